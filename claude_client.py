@@ -11,28 +11,296 @@ The client requires an Anthropic API key, which can be provided during
 instantiation or via the ANTHROPIC_API_KEY environment variable.
 """
 
+import asyncio
+import functools
+import hashlib
 import json
 import logging
 import os
+import random
+import re
 import sys
-from typing import Dict, Optional, Union
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Mapping, Optional, TextIO, Tuple, Union
 
 # Import the Anthropic library
 import anthropic
 
+# orjson is optional; it serializes large system_info dicts much faster
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
 # Import configuration management
-from config import get_config, get_claude_model, get_claude_timeout
+from config import get_config, get_claude_model, get_claude_timeout, get_max_deep_output_bytes
+from collectors.registry import DEEP_COMMANDS, FIELD_DESCRIPTIONS
+from executors.base import truncate_output
+
+import preflight
 
 # Configure logging - will inherit level from parent logger
 logger = logging.getLogger("syshealth.claude_client")
 
-class ClaudeClient:
-  """Client for interacting with the Claude API to analyze system health information.
+# Shortest system prompt Anthropic caches for Sonnet and Opus models (Haiku
+# needs 2048); a shorter block marked with cache_control is silently not cached
+MIN_CACHEABLE_PROMPT_TOKENS = 1024
+
+# Conservative characters-per-token ratio for estimating English prompt sizes
+CHARS_PER_TOKEN = 4
+
+# One report per host in a batched response, identified by its system id
+_BATCH_REPORT_RE = re.compile(r'<report id="(\d+)"[^>]*>\s*(.*?)\s*</report>', re.DOTALL)
+
+# Fields that change on every run and are ignored when looking up cached reports
+_VOLATILE_FIELDS = ("timestamp", "uptime")
+
+# Fields whose figures fluctuate between runs; cached reports are looked up
+# by their threshold level (memory) or bucketed usage (processes), see _stable_value
+_FLUCTUATING_FIELDS = ("memory", "top_cpu_processes", "top_mem_processes")
+_CACHE_BUCKET_PERCENT = 10
+
+# Swap usage treated as critical in the prompt (the warning level is preflight's)
+SWAP_USAGE_CRITICAL = 80
+
+def _bucket(percent: float) -> int:
+  """Round a percentage down to a multiple of _CACHE_BUCKET_PERCENT."""
+  return int(percent // _CACHE_BUCKET_PERCENT * _CACHE_BUCKET_PERCENT)
+
+def _level(percent: float, warning: float, critical: float) -> str:
+  """Classify a usage percentage against its warning and critical thresholds."""
+  if percent >= critical:
+    return "critical"
+  return "warning" if percent >= warning else "ok"
+
+def _stable_value(key: str, value: str, thresholds: Dict) -> str:
+  """Reduce a fluctuating field to the figures that matter for a cached report.
   
-  This client handles authentication with the Anthropic API, generates appropriate
-  prompts for system health analysis, and processes the responses. It's designed
-  to work with the system information collected by the SysHealth tool.
+  Memory becomes the total of RAM and swap and whether their usage is below,
+  at or above the configured warning and critical thresholds, so crossing a
+  threshold always changes the cache key. Process lists keep only processes
+  using at least one bucket of CPU or memory, as their command names with
+  bucketed usage, sorted so that reordering, changing PIDs and idle
+  processes drifting in and out do not matter.
+  
+  Args:
+      key (str): Field name, one of _FLUCTUATING_FIELDS
+      value (str): Collected output (`free -h` or `ps -o pid,pcpu,pmem,comm`)
+      thresholds (Dict): The ``report.thresholds`` configuration section
+  
+  Returns:
+      str: The normalized field, or the value unchanged if it cannot be parsed
+  """
+  stable, parsed = [], False
+  for line in value.splitlines():
+    fields = line.split()
+    if key == "memory":
+      if len(fields) >= 3 and fields[0] in ("Mem:", "Swap:"):
+        total, used = preflight.parse_size(fields[1]), preflight.parse_size(fields[2])
+        if fields[0] == "Mem:":
+          # Same measure as the preflight check: what is not available is in use
+          available = preflight.parse_size(fields[6]) if len(fields) >= 7 else None
+          used = used if available is None or total is None else total - available
+          warning = thresholds.get('memory_usage_warning', 85)
+          critical = thresholds.get('memory_usage_critical', 95)
+        else:
+          warning, critical = preflight.SWAP_USAGE_WARNING, SWAP_USAGE_CRITICAL
+        if total and used is not None:
+          parsed = True
+          stable.append(f"{fields[0]} {fields[1]} {_level(used / total * 100, warning, critical)}")
+    elif len(fields) >= 4:
+      try:
+        cpu, mem = _bucket(float(fields[1])), _bucket(float(fields[2]))
+      except ValueError:
+        continue
+      parsed = True
+      if cpu or mem:
+        stable.append(f"{' '.join(fields[3:])} {cpu}% {mem}%")
+  return "\n".join(sorted(stable)) if parsed else value
+
+def _dumps(obj, sort_keys: bool = False) -> str:
+  """Serialize an object to compact JSON, using orjson when available.
+  
+  Args:
+      obj: The object to serialize
+      sort_keys (bool): Whether to sort dictionary keys
+  
+  Returns:
+      str: JSON text without insignificant whitespace; non-ASCII characters
+          are kept as is (not \\u-escaped), matching orjson's output
+  """
+  if orjson is not None:
+    return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0).decode()
+  return json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys, ensure_ascii=False)
+
+_TRAILING_WHITESPACE_RE = re.compile(r"[ \t]+$", re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+def _compact_value(value: str, max_bytes: Optional[int] = None) -> str:
+  """Strip redundant whitespace from a command output and cap its size.
+  
+  Args:
+      value (str): Raw command output
+      max_bytes (Optional[int]): Output cap in bytes; defaults to get_max_output_bytes()
+  
+  Returns:
+      str: Compacted output, keeping only its most recent lines if it
+          exceeds the cap (e.g. when loaded --from-json)
+  """
+  value = _BLANK_LINES_RE.sub("\n\n", _TRAILING_WHITESPACE_RE.sub("", value.strip()))
+  return truncate_output(value, max_bytes)
+
+def _compact_system_info(system_info: Dict) -> str:
+  """Serialize system information as compact JSON for the prompt.
+  
+  Args:
+      system_info (Dict): The collected system information dictionary
+  
+  Returns:
+      str: JSON without indentation, with each string field compacted;
+          --deep fields keep up to get_max_deep_output_bytes()
+  """
+  deep_bytes = get_max_deep_output_bytes()
+  compacted = {
+    key: _compact_value(value, deep_bytes if key in DEEP_COMMANDS else None)
+    if isinstance(value, str) else value
+    for key, value in system_info.items()
+  }
+  return _dumps(compacted)
+
+def _prewarm(client: anthropic.Anthropic):
+  """Open a connection to the API with a cheap request.
+  
+  Args:
+      client (anthropic.Anthropic): Client whose connection pool to warm up
+  """
+  try:
+    client.models.list(limit=1)
+    logger.debug("Claude API connection prewarmed")
+  except Exception as e:
+    logger.debug(f"Claude API connection prewarm failed: {e}")
+
+@functools.lru_cache(maxsize=8)
+def _get_anthropic(api_key: str) -> anthropic.Anthropic:
+  """Return a process-wide Anthropic client for the given API key.
+  
+  Sharing one client across ClaudeClient instances lets multi-host runs
+  reuse the underlying HTTP connection pool instead of paying a new TLS
+  handshake per host. DNS, TCP and TLS setup are started in a background
+  thread so they overlap with system information collection.
+  
+  Args:
+      api_key (str): Anthropic API key
+  
+  Returns:
+      anthropic.Anthropic: Cached client instance
   """
+  # Retries are handled by ClaudeClient so they can be logged and tuned
+  client = anthropic.Anthropic(api_key=api_key, max_retries=0)
+  threading.Thread(target=_prewarm, args=(client,), daemon=True).start()
+  return client
+
+@functools.lru_cache(maxsize=8)
+def _get_async_anthropic(api_key: str) -> anthropic.AsyncAnthropic:
+  """Return a process-wide AsyncAnthropic client for the given API key.
+  
+  Args:
+      api_key (str): Anthropic API key
+  
+  Returns:
+      anthropic.AsyncAnthropic: Cached client instance
+  """
+  return anthropic.AsyncAnthropic(api_key=api_key, max_retries=0)
+
+def _retry_after(error: Exception) -> Optional[float]:
+  """Read the delay requested by the server from a failed request's headers.
+  
+  Args:
+      error (Exception): The exception raised by the request
+  
+  Returns:
+      Optional[float]: Seconds to wait, or None if the server did not say
+  """
+  headers = getattr(getattr(error, "response", None), "headers", None)
+  if not headers:
+    return None
+  for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1)):
+    try:
+      return float(headers[name]) * scale
+    except (KeyError, ValueError):
+      continue
+  return None
+
+def _is_rate_limited(error: Exception) -> bool:
+  """Check whether a request failed because of rate limiting or overload (429/529)."""
+  return isinstance(error, anthropic.APIStatusError) and error.status_code in (429, 529)
+
+class AdaptiveLimit:
+  """Async concurrency limit for API requests that adapts to rate limiting.
+  
+  Starts at the configured maximum. Each rate-limited response halves the
+  limit (down to 1), and the ``anthropic-ratelimit-requests-remaining``
+  header caps it before the limit is hit. After as many consecutive
+  successes as the current limit, it grows by one again.
+  
+  Args:
+      maximum (int): The largest number of concurrent requests
+  """
+  
+  def __init__(self, maximum: int):
+    self.maximum = max(1, maximum)
+    self.limit = self.maximum
+    self._active = 0
+    self._successes = 0
+    self._condition: Optional[asyncio.Condition] = None
+  
+  async def __aenter__(self) -> "AdaptiveLimit":
+    if self._condition is None:
+      self._condition = asyncio.Condition()
+    async with self._condition:
+      await self._condition.wait_for(lambda: self._active < self.limit)
+      self._active += 1
+    return self
+  
+  async def __aexit__(self, exc_type, exc_value, traceback):
+    async with self._condition:
+      self._active -= 1
+      self._condition.notify_all()
+  
+  def succeeded(self, headers=None):
+    """Record a successful request and the rate limit headers of its response."""
+    remaining = headers.get("anthropic-ratelimit-requests-remaining") if headers else None
+    if remaining is not None and remaining.isdigit() and int(remaining) < self.limit:
+      self.limit = max(1, int(remaining))
+      self._successes = 0
+      logger.info(f"Claude API requests remaining is low; limiting to {self.limit} concurrent requests")
+      return
+    self._successes += 1
+    if self.limit < self.maximum and self._successes >= self.limit:
+      self.limit += 1
+      self._successes = 0
+  
+  def throttled(self):
+    """Record a rate-limited request, halving the concurrency limit."""
+    self._successes = 0
+    if self.limit > 1:
+      self.limit = max(1, self.limit // 2)
+      logger.warning(f"Claude API rate limited; reducing to {self.limit} concurrent requests")
+
+class BaseClaudeClient(ABC):
+  """Shared base of the synchronous and asynchronous Claude clients.
+  
+  Handles authentication with the Anthropic API, prompt construction, the
+  preflight fast path and the report cache. Subclasses provide the SDK
+  client and the methods that send requests with it.
+  """
+  
+  # Static prompt prefix shared by all instances, keyed by the thresholds it was built from
+  _STATIC_PROMPT: Optional[str] = None
+  _STATIC_PROMPT_KEY: Optional[int] = None
+  _SYSTEM_BLOCKS: Optional[list] = None
   
   def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
     """Initialize the Claude client with API key and model selection.
@@ -48,7 +316,12 @@ class ClaudeClient:
     """
     self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
     self.model = model or get_claude_model()
-    self.timeout = get_claude_timeout()
+    self.reload_config()
+    
+    # When keep_prompts is set, the full prompt text of each request is
+    # kept here by hostname (for debug output) without rebuilding it
+    self.keep_prompts = False
+    self.sent_prompts: Dict[str, str] = {}
     
     if not self.api_key:
       logger.error("No API key provided and ANTHROPIC_API_KEY environment variable not set")
@@ -56,80 +329,311 @@ class ClaudeClient:
     
     # Create the client
     try:
-      self.client = anthropic.Anthropic(api_key=self.api_key)
+      self.client = self._create_client()
       logger.info(f"Claude client initialized with model: {self.model}")
     except Exception as e:
       logger.error(f"Error initializing Anthropic client: {e}")
       raise RuntimeError(f"Failed to initialize Claude client: {e}")
+    
+    # Precompute the cacheable system prompt; rebuilt only if thresholds change
+    self._refresh_system_blocks()
   
-  def analyze_system(self, system_info: Dict, language: str = "en") -> str:
-    """Analyze system information using Claude API and generate a health report.
+  def reload_config(self):
+    """Snapshot the configuration values used for requests.
     
-    This method takes the collected system information, generates an appropriate prompt
-    for Claude, sends the request to the API, and returns the generated health report.
+    Values are read once here instead of on every request; call this again
+    after reloading the global configuration to pick up changes.
+    """
+    config = get_config()
+    self.timeout = get_claude_timeout()
+    self._max_tokens = config.get('claude.max_tokens', 4000)
+    self._temperature = config.get('claude.temperature', 0.1)
+    self._thresholds = dict(config.get_section('report.thresholds'))
+    self._fast_path = config.get('report.fast_path', True)
+    self._retry_attempts = max(1, config.get('claude.retry_attempts', 4))
+    self._retry_max_delay = config.get('claude.retry_max_delay', 30)
+    self._document_threshold = config.get('claude.document_threshold', 16384)
+    self._hosts_per_request = max(1, config.get('claude.hosts_per_request', 1))
+    self._max_concurrent_requests = config.get('claude.max_concurrent_requests', 8)
+    self._report_cache_ttl = config.get('claude.report_cache_ttl', 21600)
+    self._report_cache_dir = config.get_expanded_path('claude.report_cache_directory', '~/.cache/syshealth/reports')
+    self._report_cache_max_entries = max(1, config.get('claude.report_cache_max_entries', 256))
+  
+  def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+    """Decide whether a failed request should be retried, and after how long.
+    
+    Rate limits (429), overloaded/server errors (5xx) and connection
+    failures are retried with jittered exponential backoff, or after the
+    delay given by the response's ``retry-after`` header when there is one.
+    Permanent errors such as authentication failures or invalid requests
+    are not.
+    
+    Args:
+        error (Exception): The exception raised by the request
+        attempt (int): The attempt number that failed, starting at 1
+    
+    Returns:
+        Optional[float]: Seconds to wait before retrying, or None to give up
+    """
+    if attempt >= self._retry_attempts:
+      return None
+    if isinstance(error, anthropic.APIStatusError):
+      if error.status_code != 429 and error.status_code < 500:
+        return None
+    elif not isinstance(error, anthropic.APIConnectionError):
+      return None
+    
+    retry_after = _retry_after(error)
+    if retry_after is None:
+      retry_after = min(self._retry_max_delay, 2 ** (attempt - 1))
+    delay = retry_after + random.uniform(0, 1)
+    logger.warning(
+      f"Claude API request failed (attempt {attempt}/{self._retry_attempts}): {error}; "
+      f"retrying in {delay:.1f}s"
+    )
+    return delay
+  
+  @abstractmethod
+  def _create_client(self):
+    """Create or get the Anthropic SDK client used for API calls."""
+  
+  def _prepare_request(self, system_info: Dict, language: str) -> Dict:
+    """Build the Messages API request for a host that has no cached report.
+    
+    The prompt is logged in debug mode and kept in ``sent_prompts`` when
+    ``keep_prompts`` is set, so call this only once the request will be sent.
     
     Args:
         system_info (Dict): Dictionary containing all the collected system information
-        language (str, optional): The language code for the report. Defaults to "en" (English).
-            Can be any language code supported by Claude (e.g., "es", "fr", "de", etc.)
+        language (str): The language code for the report
     
     Returns:
-        str: The markdown-formatted system health report generated by Claude
+        Dict: Keyword arguments for ``messages.create``
+    """
+    # The static instructions go in a cached system block; only the
+    # per-host data is sent as the user message
+    system_blocks = self._refresh_system_blocks()
+    user_content = self._user_content(system_info, language)
     
-    Raises:
-        RuntimeError: If the API call fails for any reason
+    # Log the prompt in debug mode, reusing the text already built for the request
+    if self.keep_prompts or logger.isEnabledFor(logging.DEBUG):
+      user_prompt = self._user_text(user_content)
+      logger.debug(f"Prompt sent to Claude API:\n{'-'*40}\n{user_prompt}\n{'-'*40}")
+      if self.keep_prompts:
+        self.sent_prompts[system_info.get("hostname", "unknown")] = f"{self._STATIC_PROMPT}\n{user_prompt}\n"
+    
+    request = {
+      "model": self.model,
+      "max_tokens": self._max_tokens,
+      "temperature": self._temperature,
+      "timeout": self.timeout,
+      "system": system_blocks,
+      "messages": [
+        {
+          "role": "user",
+          "content": user_content
+        }
+      ]
+    }
+    return request
+  
+  def _fast_path_report(self, system_info: Dict, language: str, stream: bool,
+                        stream_to: Optional[TextIO]) -> Optional[str]:
+    """Return a templated report if the preflight checks find nothing to analyze.
+    
+    The template is English only, so other languages always use Claude.
+    
+    Args:
+        system_info (Dict): Dictionary containing all the collected system information
+        language (str): The language code for the report
+        stream (bool): Whether the caller requested streaming
+        stream_to (Optional[TextIO]): Stream that receives report text
+    
+    Returns:
+        Optional[str]: The templated report, or None if Claude should be called
     """
-    # Generate the prompt for Claude
-    prompt = self._generate_prompt(system_info, language)
+    if not self._fast_path or language.lower() not in ("en", "english"):
+      return None
     
-    # Log the prompt in debug mode
-    logger.debug(f"Prompt sent to Claude API:\n{'-'*40}\n{prompt}\n{'-'*40}")
+    issues = preflight.find_issues(system_info, self._thresholds)
+    if issues:
+      logger.info(f"Preflight found items for analysis: {'; '.join(issues)}")
+      return None
     
-    # Call the API
-    try:
-      logger.info(f"Calling Claude API with model: {self.model}")
-      
-      config = get_config()
-      max_tokens = config.get('claude.max_tokens', 4000)
-      temperature = config.get('claude.temperature', 0.1)
-      
-      response = self.client.messages.create(
-        model=self.model,
-        max_tokens=max_tokens,
-        temperature=temperature,
-        timeout=self.timeout,
-        messages=[
-          {
-            "role": "user",
-            "content": prompt
-          }
-        ]
-      )
-      
-      logger.info("Claude API response received successfully")
-      
-      # In debug mode, we can also log the response length
-      logger.debug(f"Received response of {len(response.content[0].text)} characters from Claude API")
-      
-      return response.content[0].text
-    except Exception as e:
-      logger.error(f"Error calling Claude API: {e}")
-      raise RuntimeError(f"Failed to get response from Claude API: {e}")
+    logger.info("Preflight checks passed; skipping Claude API call")
+    report = preflight.render_healthy_report(system_info)
+    if stream and stream_to is not None:
+      stream_to.write(report)
+      stream_to.flush()
+    return report
+  
+  def _use_cached_report(self, cache_path: Optional[str], stream: bool,
+                         stream_to: Optional[TextIO]) -> Optional[str]:
+    """Return a cached report, echoing it to the stream as a live response would be.
+    
+    Args:
+        cache_path (Optional[str]): Path returned by _report_cache_path
+        stream (bool): Whether the caller requested streaming
+        stream_to (Optional[TextIO]): Stream that receives report text
+    
+    Returns:
+        Optional[str]: The cached report, or None on a miss
+    """
+    cached_report = self._read_cached_report(cache_path)
+    if cached_report is not None:
+      logger.info(f"Using cached report: {cache_path}")
+      if stream and stream_to is not None:
+        stream_to.write(cached_report)
+        stream_to.flush()
+    return cached_report
   
-  def _generate_prompt(self, system_info: Dict, language: str) -> str:
-    """Generate a detailed prompt for Claude to analyze system health.
+  def _report_cache_path(self, system_info: Dict, language: str) -> Optional[str]:
+    """Get the report cache file for this system state, model, and language.
     
-    Creates a prompt instructing Claude to act as a system administrator,
-    analyze the provided system information, and generate a comprehensive
-    health report in the specified language. The prompt defines the expected
-    report structure and criteria for identifying issues.
+    The cache key is a hash of the system information with volatile fields
+    (timestamp, uptime and load averages) removed and fluctuating ones
+    (memory and top processes) reduced to threshold levels or bucketed
+    usage, together with the preflight findings, the language and the
+    static prompt. A new finding (such as load crossing its threshold) or
+    any change to the instructions therefore always misses the cache.
     
     Args:
         system_info (Dict): The collected system information dictionary
         language (str): The language code for the output report
     
     Returns:
-        str: The formatted prompt to send to Claude API
+        Optional[str]: Path of the cache file, or None if caching is disabled
+    """
+    if self._report_cache_ttl <= 0:
+      return None
+    
+    thresholds = self._thresholds
+    normalized = {
+      k: _stable_value(k, v, thresholds) if k in _FLUCTUATING_FIELDS and isinstance(v, str) else v
+      for k, v in system_info.items() if k not in _VOLATILE_FIELDS
+    }
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(self._STATIC_PROMPT.encode())
+    digest.update(language.encode())
+    digest.update(_dumps(sorted(preflight.find_issues(system_info, thresholds))).encode())
+    digest.update(_dumps(normalized, sort_keys=True).encode())
+    
+    return os.path.join(self._report_cache_dir, self.model.replace(os.sep, "_"), f"{digest.hexdigest()}.md")
+  
+  def _read_cached_report(self, cache_path: Optional[str]) -> Optional[str]:
+    """Read a cached report if it exists and has not expired.
+    
+    An expired report is deleted. A hit records the time of use as the
+    file's access time, which _prune_report_cache() orders entries by; the
+    modification time, which the TTL is measured from, is left alone.
+    
+    Args:
+        cache_path (Optional[str]): Path returned by _report_cache_path
+    
+    Returns:
+        Optional[str]: The cached report, or None on a miss
+    """
+    if cache_path is None:
+      return None
+    try:
+      mtime = os.path.getmtime(cache_path)
+      if time.time() - mtime > self._report_cache_ttl:
+        os.unlink(cache_path)
+        return None
+      with open(cache_path, "r") as f:
+        report = f.read()
+      os.utime(cache_path, (time.time(), mtime))
+      return report
+    except OSError:
+      return None
+  
+  def _write_cached_report(self, cache_path: Optional[str], report: str):
+    """Store a report in the cache, ignoring any filesystem errors.
+    
+    Args:
+        cache_path (Optional[str]): Path returned by _report_cache_path
+        report (str): The report to store
+    """
+    if cache_path is None:
+      return
+    try:
+      os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+      with open(cache_path, "w") as f:
+        f.write(report)
+    except OSError as e:
+      logger.warning(f"Failed to write report cache {cache_path}: {e}")
+      return
+    self._prune_report_cache(os.path.dirname(cache_path))
+  
+  def _prune_report_cache(self, cache_dir: str):
+    """Delete expired reports and keep only the most recently used ones.
+    
+    Args:
+        cache_dir (str): The per-model report cache directory
+    """
+    now = time.time()
+    entries = []
+    try:
+      with os.scandir(cache_dir) as scan:
+        for entry in scan:
+          if not entry.name.endswith(".md"):
+            continue
+          stat = entry.stat()
+          if now - stat.st_mtime > self._report_cache_ttl:
+            os.unlink(entry.path)
+          else:
+            entries.append((stat.st_atime, entry.path))
+      entries.sort(reverse=True)
+      for _, path in entries[self._report_cache_max_entries:]:
+        os.unlink(path)
+    except OSError as e:
+      logger.debug(f"Failed to prune report cache {cache_dir}: {e}")
+  
+  def _refresh_system_blocks(self) -> list:
+    """Return the cached system prompt blocks, rebuilding them if thresholds changed.
+    
+    The static block is built once per process and shared by every client
+    instance, so each request carries a byte-identical prefix. It is marked
+    with ``cache_control`` so that Anthropic can reuse the processed prefix
+    across hosts and repeated runs; that only works while it is at least
+    MIN_CACHEABLE_PROMPT_TOKENS long, which is why the field glossary and
+    all output rules live in it rather than in the user message.
+    
+    Returns:
+        list: System content blocks to pass to ``messages.create``
+    """
+    cls = type(self)
+    thresholds = self._thresholds
+    thresholds_key = hash(tuple(sorted(thresholds.items())))
+    if cls._SYSTEM_BLOCKS is None or thresholds_key != cls._STATIC_PROMPT_KEY:
+      if cls._SYSTEM_BLOCKS is not None:
+        logger.warning("Report thresholds changed during the run; rebuilding the cached prompt prefix")
+      cls._STATIC_PROMPT = self._static_prompt(thresholds)
+      cls._STATIC_PROMPT_KEY = thresholds_key
+      if len(cls._STATIC_PROMPT) < MIN_CACHEABLE_PROMPT_TOKENS * CHARS_PER_TOKEN:
+        logger.warning("Static prompt is likely below the minimum cacheable size; prompt caching will not apply")
+      cls._SYSTEM_BLOCKS = [
+        {
+          "type": "text",
+          "text": cls._STATIC_PROMPT,
+          "cache_control": {"type": "ephemeral"}
+        }
+      ]
+    return cls._SYSTEM_BLOCKS
+  
+  def _static_prompt(self, thresholds: Dict) -> str:
+    """Build the static instruction portion of the prompt.
+    
+    Creates the instructions telling Claude to act as a system administrator,
+    a glossary of the collected fields, the expected report structure, and
+    the criteria for identifying issues. This text contains no per-host or
+    per-run values so it forms a stable, cacheable prefix.
+    
+    Args:
+        thresholds (Dict): The ``report.thresholds`` configuration section
+    
+    Returns:
+        str: The static instruction text
     
     Report sections defined in the prompt:
         1. System Overview
@@ -142,25 +646,38 @@ class ClaudeClient:
         8. Critical Issues
         9. Warnings
         10. Recommendations
+        
+    followed by a fenced JSON summary for downstream tooling.
     """
-    config = get_config()
-    sections = config.get('report.sections', [
-        "system_overview", "hardware_config", "storage_status", "memory_usage",
-        "cpu_performance", "network_config", "system_health", "critical_issues",
-        "warnings", "recommendations"
-    ])
-    
-    thresholds = config.get_section('report.thresholds')
     disk_warning = thresholds.get('disk_usage_warning', 80)
     disk_critical = thresholds.get('disk_usage_critical', 90)
     memory_warning = thresholds.get('memory_usage_warning', 85)
     memory_critical = thresholds.get('memory_usage_critical', 95)
     cpu_warning = thresholds.get('cpu_load_warning', 2.0)
     cpu_critical = thresholds.get('cpu_load_critical', 4.0)
+    glossary = "\n".join(f"- {key}: {description}" for key, description in FIELD_DESCRIPTIONS.items())
     
-    prompt = f"""
+    return f"""
 You are a skilled system administrator tasked with analyzing a Linux system's health.
-Analyze the following system information and create a comprehensive health report.
+Analyze the system information provided by the user and create a comprehensive health report.
+Long outputs and log excerpts keep only their most recent lines (they then start
+with "...[truncated]..."), so do not treat missing older entries as evidence.
+
+The system information is a JSON object with these fields:
+{glossary}
+
+Interpreting the data:
+- A field holding a fallback message such as "Information not available" or
+  "... not available (requires root)" could not be collected. Mention the gap where it
+  matters (for example, no SMART data for a server), but report it neither as a problem
+  nor as evidence that the area is healthy.
+- Memory usage is (total - available) / total; low "free" memory alone is normal on Linux.
+- Judge load averages against the number of CPUs in cpu_info as well as the thresholds below,
+  and prefer the 15 minute average when deciding whether load is sustained.
+- A failed unit, an INFECTED or Warning line in rootkit_check, or a failing SMART result
+  always belongs in Critical Issues, whatever the other metrics show.
+- Only report what the data shows. Do not invent metrics, processes, ports or log entries,
+  and quote the relevant values (mount point, percentage, process name, unit name).
 
 The report should be in markdown format with these sections:
 1. System Overview - Brief overview of the system (hostname, OS version, uptime)
@@ -176,10 +693,18 @@ The report should be in markdown format with these sections:
 
 Be direct and critical in your assessment. Focus on potential problems and their solutions.
 
+Thresholds used for this assessment:
+| Metric | Warning | Critical |
+|--------|---------|----------|
+| Disk usage (%) | {disk_warning} | {disk_critical} |
+| Memory usage (%) | {memory_warning} | {memory_critical} |
+| CPU load average | {cpu_warning} | {cpu_critical} |
+
 Look for these critical issues (include in Critical Issues section):
 - Very high disk usage (>{disk_critical}% is critical)
 - Critical memory shortage (<{100-memory_critical}% available)
-- High swap usage (>80% used)
+- High swap usage (>{SWAP_USAGE_CRITICAL}% used)
+- Sustained CPU load average above {cpu_critical}
 - Failed system services
 - Root or privileged access attempts
 - Signs of system compromise
@@ -200,14 +725,387 @@ Look for these warning signs (include in Warnings section):
 Recommendations should be specific to the system's issues, not generic advice.
 For example, if a specific partition is running out of space, recommend actions for that partition.
 
-Output language: {language}
+End the report with a "Machine-Readable Summary" section containing a single fenced
+```json code block for automated tools, with exactly these keys (in English):
+{{"critical": [...], "warnings": [...], "recommendations": [...], "summary": "..."}}
+The lists hold one short string per item (empty if there are none) and "summary"
+is a one-sentence overall assessment.
 
-System Information:
--------------------
-{json.dumps(system_info, indent=2)}
+Write the entire report in the output language given by the user.
+
+When the user message contains several <system id="N" host="..."> blocks, analyze each
+system separately and write one complete report per system, wrapped in
+<report id="N">...</report>, where N is the id of the <system> it describes.
+Do not write anything outside the report blocks in that case.
 """
-    return prompt
   
-# Removed simulate_response method - now using real API calls only
+  def _user_content(self, system_info: Dict, language: str) -> Union[str, List[Dict]]:
+    """Build the user message content for a request.
+    
+    Small payloads are inlined as text. Payloads larger than
+    ``claude.document_threshold`` bytes are attached as a plain-text
+    document block ahead of the instructions, which keeps the message
+    itself short and follows the long-context guidance of placing
+    documents before the query.
+    
+    Args:
+        system_info (Dict): The collected system information dictionary
+        language (str): The language code for the output report
+    
+    Returns:
+        Union[str, List[Dict]]: Message content for the user turn
+    """
+    data = _compact_system_info(system_info)
+    if not self._document_threshold or len(data) <= self._document_threshold:
+      return f"Output language: {language}\nSystem Information:\n{data}"
+    
+    return [
+      {
+        "type": "document",
+        "source": {"type": "text", "media_type": "text/plain", "data": data},
+        "title": "System Information (JSON)"
+      },
+      {
+        "type": "text",
+        "text": f"Output language: {language}\nThe system information is attached as a JSON document."
+      }
+    ]
+  
+  @staticmethod
+  def _user_text(user_content: Union[str, List[Dict]]) -> str:
+    """Flatten user message content built by _user_content() into plain text.
+    
+    Args:
+        user_content (Union[str, List[Dict]]): Message content for the user turn
+    
+    Returns:
+        str: The text of the message, with any attached document first
+    """
+    if isinstance(user_content, str):
+      return user_content
+    return "\n".join(
+      block["source"]["data"] if block["type"] == "document" else block["text"]
+      for block in user_content
+    )
+  
+class ClaudeClient(BaseClaudeClient):
+  """Client for interacting with the Claude API to analyze system health information.
+  
+  This client handles authentication with the Anthropic API, generates appropriate
+  prompts for system health analysis, and processes the responses. It's designed
+  to work with the system information collected by the SysHealth tool.
+  """
+  
+  def _create_client(self):
+    """Get the shared Anthropic SDK client used for API calls.
+    
+    Returns:
+        anthropic.Anthropic: The SDK client for this client's API key
+    """
+    return _get_anthropic(self.api_key)
+  
+  def analyze_system(self, system_info: Dict, language: str = "en", stream: bool = True,
+                     stream_to: Optional[TextIO] = None, force_ai: bool = False) -> str:
+    """Analyze system information using Claude API and generate a health report.
+    
+    This method takes the collected system information, generates an appropriate prompt
+    for Claude, sends the request to the API, and returns the generated health report.
+    
+    Args:
+        system_info (Dict): Dictionary containing all the collected system information
+        language (str, optional): The language code for the report. Defaults to "en" (English).
+            Can be any language code supported by Claude (e.g., "es", "fr", "de", etc.)
+        stream (bool, optional): Whether to stream the response as it is generated.
+            Defaults to True. Set to False to use a single blocking request.
+        stream_to (Optional[TextIO], optional): When streaming, a text stream (such as
+            sys.stdout) that receives each chunk of the report as it arrives
+        force_ai (bool, optional): Always call Claude, even when the preflight
+            checks find nothing wrong. Defaults to False.
+    
+    Returns:
+        str: The markdown-formatted system health report generated by Claude
+    
+    Raises:
+        RuntimeError: If the API call fails for any reason
+    """
+    # Healthy systems get a templated report without calling Claude
+    if not force_ai:
+      fast_report = self._fast_path_report(system_info, language, stream, stream_to)
+      if fast_report is not None:
+        return fast_report
+    
+    # Reuse a recent report if the system state has not changed
+    cache_path = self._report_cache_path(system_info, language)
+    cached_report = self._use_cached_report(cache_path, stream, stream_to)
+    if cached_report is not None:
+      return cached_report
+    
+    request = self._prepare_request(system_info, language)
+    
+    # Call the API, retrying transient failures with backoff
+    logger.info(f"Calling Claude API with model: {self.model}")
+    for attempt in range(1, self._retry_attempts + 1):
+      try:
+        report = self._request_report(request, stream, stream_to)
+        break
+      except Exception as e:
+        delay = self._retry_delay(e, attempt)
+        if delay is None:
+          logger.error(f"Error calling Claude API: {e}")
+          raise RuntimeError(f"Failed to get response from Claude API: {e}")
+        time.sleep(delay)
+    
+    logger.info("Claude API response received successfully")
+    
+    # In debug mode, we can also log the response length
+    logger.debug(f"Received response of {len(report)} characters from Claude API")
+    
+    self._write_cached_report(cache_path, report)
+    return report
+  
+  def _request_report(self, request: Dict, stream: bool, stream_to: Optional[TextIO]) -> str:
+    """Send one Messages API request and return the report text.
+    
+    Args:
+        request (Dict): Keyword arguments for ``messages.create``
+        stream (bool): Whether to stream the response
+        stream_to (Optional[TextIO]): Stream that receives report text as it arrives
+    
+    Returns:
+        str: The report text
+    """
+    if stream:
+      chunks = []
+      with self.client.messages.stream(**request) as response_stream:
+        for text in response_stream.text_stream:
+          chunks.append(text)
+          if stream_to is not None:
+            stream_to.write(text)
+            stream_to.flush()
+      return "".join(chunks)
+    
+    response = self.client.messages.create(**request)
+    return response.content[0].text
+
+class AsyncClaudeClient(BaseClaudeClient):
+  """Asynchronous variant of ClaudeClient built on ``anthropic.AsyncAnthropic``.
+  
+  Lets reports for several hosts be generated concurrently from one event
+  loop, sharing the prompt construction and report cache of
+  BaseClaudeClient with ClaudeClient.
+  """
+  
+  def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
+    """Initialize the client; see BaseClaudeClient.
+    
+    Concurrent requests made through this client share one AdaptiveLimit,
+    starting at ``claude.max_concurrent_requests``.
+    """
+    super().__init__(api_key, model)
+    self._request_limit = AdaptiveLimit(self._max_concurrent_requests)
+  
+  def _create_client(self):
+    """Get the shared async Anthropic SDK client used for API calls.
+    
+    Returns:
+        anthropic.AsyncAnthropic: The SDK client for this client's API key
+    """
+    return _get_async_anthropic(self.api_key)
+  
+  async def prewarm(self):
+    """Open a connection to the API with a cheap request.
+    
+    Intended to run as a task alongside system information collection so
+    the connection is ready when the first analysis request is sent.
+    Failures are logged and otherwise ignored.
+    """
+    try:
+      await self.client.models.list(limit=1)
+      logger.debug("Claude API connection prewarmed")
+    except Exception as e:
+      logger.debug(f"Claude API connection prewarm failed: {e}")
+  
+  async def analyze_system_async(self, system_info: Dict, language: str = "en", stream: bool = True,
+                                 stream_to: Optional[TextIO] = None, force_ai: bool = False) -> str:
+    """Analyze system information using Claude API without blocking the event loop.
+    
+    Args:
+        system_info (Dict): Dictionary containing all the collected system information
+        language (str, optional): The language code for the report. Defaults to "en".
+        stream (bool, optional): Whether to stream the response. Defaults to True.
+        stream_to (Optional[TextIO], optional): Text stream that receives each chunk
+            of the report as it arrives
+        force_ai (bool, optional): Always call Claude, even when the preflight
+            checks find nothing wrong. Defaults to False.
+    
+    Returns:
+        str: The markdown-formatted system health report generated by Claude
+    
+    Raises:
+        RuntimeError: If the API call fails for any reason
+    """
+    if not force_ai:
+      fast_report = self._fast_path_report(system_info, language, stream, stream_to)
+      if fast_report is not None:
+        return fast_report
+    
+    cache_path = self._report_cache_path(system_info, language)
+    cached_report = self._use_cached_report(cache_path, stream, stream_to)
+    if cached_report is not None:
+      return cached_report
+    
+    request = self._prepare_request(system_info, language)
+    
+    report = await self._request_with_retries_async(request, stream, stream_to)
+    self._write_cached_report(cache_path, report)
+    return report
+  
+  async def analyze_systems_async(self, system_infos: List[Dict], language: str = "en",
+                                  force_ai: bool = False) -> List[Union[str, BaseException]]:
+    """Analyze several systems with a single Claude request.
+    
+    Systems that pass the preflight checks or have a cached report are
+    answered locally; the rest are sent together in one prompt, with Claude
+    asked to return one ``<report id="N">`` block per system. Each report is
+    cached individually, exactly as if it had been requested on its own.
+    
+    Args:
+        system_infos (List[Dict]): System information for each host
+        language (str, optional): The language code for the reports. Defaults to "en".
+        force_ai (bool, optional): Always call Claude, even when the preflight
+            checks find nothing wrong. Defaults to False.
+    
+    Returns:
+        List[Union[str, BaseException]]: The report for each system, in order,
+            or the exception explaining why it could not be generated
+    """
+    results: List[Union[str, BaseException, None]] = [None] * len(system_infos)
+    pending = []
+    for index, system_info in enumerate(system_infos):
+      report = None if force_ai else self._fast_path_report(system_info, language, False, None)
+      cache_path = self._report_cache_path(system_info, language)
+      if report is None:
+        report = self._use_cached_report(cache_path, False, None)
+      if report is None:
+        pending.append((index, system_info, cache_path))
+      results[index] = report
+    
+    if len(pending) == 1:
+      index, system_info, _ = pending[0]
+      try:
+        results[index] = await self.analyze_system_async(system_info, language, stream=False, force_ai=True)
+      except Exception as e:
+        results[index] = e
+    elif pending:
+      request = self._prepare_batch_request([info for _, info, _ in pending], language)
+      try:
+        response = await self._request_with_retries_async(request, False, None)
+      except Exception as e:
+        response = e
+      
+      reports = {} if isinstance(response, BaseException) else {
+        int(report_id): report for report_id, report in _BATCH_REPORT_RE.findall(response)
+      }
+      for number, (index, system_info, cache_path) in enumerate(pending, 1):
+        if isinstance(response, BaseException):
+          results[index] = response
+        elif number in reports:
+          results[index] = reports[number]
+          self._write_cached_report(cache_path, reports[number])
+        else:
+          results[index] = RuntimeError(
+            f"Batched Claude response did not include a report for {system_info.get('hostname', 'unknown')}"
+          )
+    return results
+  
+  def _prepare_batch_request(self, system_infos: List[Dict], language: str) -> Dict:
+    """Build a Messages API request covering several systems.
+    
+    Args:
+        system_infos (List[Dict]): System information for each host
+        language (str): The language code for the reports
+    
+    Returns:
+        Dict: Keyword arguments for ``messages.create``
+    """
+    sections = "\n".join(
+      f'<system id="{number}" host="{info.get("hostname", "unknown")}">\n'
+      f'{_compact_system_info(info)}\n</system>'
+      for number, info in enumerate(system_infos, 1)
+    )
+    user_prompt = (
+      f"Output language: {language}\n"
+      f"Write one <report> block for each of the following {len(system_infos)} systems.\n\n"
+      f"{sections}"
+    )
+    return {
+      "model": self.model,
+      "max_tokens": self._max_tokens,
+      "temperature": self._temperature,
+      "timeout": self.timeout,
+      "system": self._refresh_system_blocks(),
+      "messages": [{"role": "user", "content": user_prompt}]
+    }
+  
+  async def _request_with_retries_async(self, request: Dict, stream: bool, stream_to: Optional[TextIO]) -> str:
+    """Send a request, retrying transient failures with backoff.
+    
+    Args:
+        request (Dict): Keyword arguments for ``messages.create``
+        stream (bool): Whether to stream the response
+        stream_to (Optional[TextIO]): Stream that receives report text as it arrives
+    
+    Returns:
+        str: The response text
+    
+    Raises:
+        RuntimeError: If the request fails permanently or retries are exhausted
+    """
+    logger.info(f"Calling Claude API with model: {self.model}")
+    for attempt in range(1, self._retry_attempts + 1):
+      try:
+        async with self._request_limit:
+          report, headers = await self._request_report_async(request, stream, stream_to)
+          self._request_limit.succeeded(headers)
+        break
+      except Exception as e:
+        if _is_rate_limited(e):
+          self._request_limit.throttled()
+        delay = self._retry_delay(e, attempt)
+        if delay is None:
+          logger.error(f"Error calling Claude API: {e}")
+          raise RuntimeError(f"Failed to get response from Claude API: {e}")
+        await asyncio.sleep(delay)
+    
+    logger.info("Claude API response received successfully")
+    logger.debug(f"Received response of {len(report)} characters from Claude API")
+    return report
+  
+  async def _request_report_async(self, request: Dict, stream: bool,
+                                  stream_to: Optional[TextIO]) -> Tuple[str, Optional[Mapping[str, str]]]:
+    """Send one Messages API request without blocking and return the report text.
+    
+    Args:
+        request (Dict): Keyword arguments for ``messages.create``
+        stream (bool): Whether to stream the response
+        stream_to (Optional[TextIO]): Stream that receives report text as it arrives
+    
+    Returns:
+        Tuple[str, Optional[Mapping[str, str]]]: The report text and the HTTP
+            response headers, if available
+    """
+    if stream:
+      chunks = []
+      async with self.client.messages.stream(**request) as response_stream:
+        async for text in response_stream.text_stream:
+          chunks.append(text)
+          if stream_to is not None:
+            stream_to.write(text)
+            stream_to.flush()
+      return "".join(chunks), getattr(getattr(response_stream, "response", None), "headers", None)
+    
+    raw = await self.client.messages.with_raw_response.create(**request)
+    response = raw.parse()
+    return response.content[0].text, raw.headers
 
 #fin
\ No newline at end of file
@@ -3,9 +3,13 @@
 This module provides specialized collectors for different aspects of system information.
 Each collector focuses on a specific category of system data, making the code more
 modular, testable, and maintainable.
+
+The commands behind each collector are declared in COLLECTOR_SPECS;
+run_collectors() runs all of them as a single batch.
 """
 
-from .base import SystemInfoCollector
+from .base import SystemInfoCollector, run_collectors
+from .registry import COLLECTOR_SPECS
 from .basic import BasicSystemInfoCollector
 from .hardware import HardwareInfoCollector
 from .storage import StorageInfoCollector
@@ -14,6 +18,8 @@ from .network import NetworkInfoCollector
 from .security import SecurityInfoCollector
 
 __all__ = [
+  "COLLECTOR_SPECS",
+  "run_collectors",
   "SystemInfoCollector",
   "BasicSystemInfoCollector", 
   "HardwareInfoCollector",
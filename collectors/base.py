@@ -1,53 +1,145 @@
 #!/usr/bin/env python3
 
-"""Base system information collector class."""
+"""Base system information collector class and generic collection runner."""
 
-from abc import ABC, abstractmethod
-from typing import Dict
-from executors.base import CommandExecutor
+import datetime
+from typing import Dict, Iterable, Optional, Tuple
+from collectors.registry import (
+  COLLECTOR_SPECS, COMMAND_TIMEOUTS, DEEP_COMMANDS, DEEP_FILTERS, CollectorSpec
+)
+from config import get_max_deep_output_bytes
+from config.system_commands import SystemInfoConfig
+from executors.base import CommandExecutor, truncate_output
 
-class SystemInfoCollector(ABC):
-  """Abstract base class for system information collectors.
+async def gather(executor: CommandExecutor, commands: Dict[str, Tuple[str, str]],
+                 timeouts: Optional[Dict[str, float]] = None,
+                 max_bytes: Optional[Dict[str, int]] = None) -> Dict[str, str]:
+  """Run several commands in one batch and map their outputs to keys.
   
-  This class defines the interface that all specialized collectors must implement.
-  It uses dependency injection to receive a command executor, enabling better
-  testing and flexibility.
+  All commands are sent to the executor as a single batch (one shell or
+  SSH invocation), where they run concurrently. A command that exceeds
+  its timeout is killed and replaced by its fallback, so one hung command
+  cannot hold up the rest of the report.
+  
+  Args:
+      executor (CommandExecutor): The executor to run the batch with
+      commands (Dict[str, Tuple[str, str]]): Mapping of result key to
+          a (command, fallback) pair
+      timeouts (Optional[Dict[str, float]]): Per-key timeouts in seconds;
+          other commands use the configured command timeout
+      max_bytes (Optional[Dict[str, int]]): Per-key output caps in bytes;
+          other outputs are capped at get_max_output_bytes()
+      
+  Returns:
+      Dict[str, str]: Mapping of result key to command output or fallback
+  """
+  timeouts = timeouts or {}
+  max_bytes = max_bytes or {}
+  try:
+    results = await executor.execute_batch_async(
+      [command for command, _ in commands.values()],
+      [timeouts.get(key) for key in commands]
+    )
+  except Exception as e:
+    results = [f"Error: {e}"] * len(commands)
+  
+  return {
+    key: fallback if result.startswith("Error") else truncate_output(result, max_bytes.get(key))
+    for (key, (_, fallback)), result in zip(commands.items(), results)
+  }
+
+async def run_specs(executor: CommandExecutor, config: SystemInfoConfig,
+                    specs: Iterable[CollectorSpec], deep: bool = False) -> Dict[str, str]:
+  """Run the commands described by registry specs as one batch.
+  
+  Args:
+      executor (CommandExecutor): The executor to run the batch with
+      config (SystemInfoConfig): Command configuration to resolve attributes from
+      specs (Iterable[CollectorSpec]): (key, command attribute, fallback) entries
+      deep (bool, optional): Use the detailed command variants. Defaults to False.
+      
+  Returns:
+      Dict[str, str]: Mapping of result key to command output or fallback
+  """
+  commands, timeouts, max_bytes = {}, {}, {}
+  for key, attribute, fallback in specs:
+    if deep and key in DEEP_COMMANDS:
+      attribute = DEEP_COMMANDS[key]
+      max_bytes[key] = get_max_deep_output_bytes()
+    elif key in COMMAND_TIMEOUTS:
+      timeouts[key] = getattr(config, COMMAND_TIMEOUTS[key])
+    commands[key] = (getattr(config, attribute), fallback)
+  
+  info = await gather(executor, commands, timeouts, max_bytes)
+  if deep:
+    for key, pattern in DEEP_FILTERS.items():
+      if key in info:
+        info[key] = pattern.sub("", info[key])
+  return info
+
+def host_identity(hostname: str) -> Dict[str, str]:
+  """Get the fields identifying a collection run.
+  
+  Args:
+      hostname (str): The system hostname
+      
+  Returns:
+      Dict[str, str]: The hostname and the collection timestamp
+  """
+  return {
+    "hostname": hostname,
+    "timestamp": datetime.datetime.now().isoformat(),
+  }
+
+async def run_collectors(executor: CommandExecutor, hostname: str,
+                         config: Optional[SystemInfoConfig] = None, deep: bool = False) -> Dict[str, str]:
+  """Collect everything in COLLECTOR_SPECS with a single batch.
+  
+  Equivalent to running every collector class, but all commands share one
+  shell (or SSH) invocation, so wall time is bounded by the slowest command.
+  
+  Args:
+      executor (CommandExecutor): The executor to run the batch with
+      hostname (str): The system hostname
+      config (Optional[SystemInfoConfig]): Command configuration
+      deep (bool, optional): Use the detailed command variants. Defaults to False.
+      
+  Returns:
+      Dict[str, str]: The combined output of all collectors
+  """
+  info = host_identity(hostname)
+  specs = [spec for group in COLLECTOR_SPECS.values() for spec in group]
+  info.update(await run_specs(executor, config or SystemInfoConfig(), specs, deep))
+  return info
+
+class SystemInfoCollector:
+  """Base class for system information collectors.
+  
+  Each collector runs the commands listed for its ``name`` in
+  COLLECTOR_SPECS. It uses dependency injection to receive a command
+  executor, enabling better testing and flexibility.
   """
   
-  def __init__(self, executor: CommandExecutor):
+  # Key into COLLECTOR_SPECS; set by subclasses
+  name: str = ""
+  
+  def __init__(self, executor: CommandExecutor, config: Optional[SystemInfoConfig] = None):
     """Initialize the collector with a command executor.
     
     Args:
         executor (CommandExecutor): The command executor to use for running commands
+        config (Optional[SystemInfoConfig]): Command configuration
     """
     self.executor = executor
+    self.config = config or SystemInfoConfig()
     
-  @abstractmethod
-  def collect(self) -> Dict[str, str]:
+  async def collect(self) -> Dict[str, str]:
     """Collect system information for this collector's domain.
     
     Returns:
         Dict[str, str]: Dictionary containing the collected information
             with descriptive keys and string values (command outputs)
     """
-    pass
-    
-  def _safe_execute(self, command: str, fallback: str = "Information not available") -> str:
-    """Safely execute a command with fallback handling.
-    
-    Args:
-        command (str): The command to execute
-        fallback (str): Fallback message if command fails
-        
-    Returns:
-        str: Command output or fallback message
-    """
-    try:
-      result = self.executor.execute(command)
-      if result.startswith("Error"):
-        return fallback
-      return result
-    except Exception:
-      return fallback
+    return await run_specs(self.executor, self.config, COLLECTOR_SPECS[self.name])
 
 #fin
\ No newline at end of file
@@ -2,9 +2,8 @@
 
 """Basic system information collector."""
 
-import datetime
 from typing import Dict
-from collectors.base import SystemInfoCollector
+from collectors.base import SystemInfoCollector, host_identity
 from config.system_commands import SystemInfoConfig
 
 class BasicSystemInfoCollector(SystemInfoCollector):
@@ -14,6 +13,8 @@ class BasicSystemInfoCollector(SystemInfoCollector):
   that forms the foundation of any system health report.
   """
   
+  name = "basic"
+  
   def __init__(self, executor, hostname: str, config: SystemInfoConfig = None):
     """Initialize the basic system info collector.
     
@@ -22,24 +23,17 @@ class BasicSystemInfoCollector(SystemInfoCollector):
         hostname (str): The system hostname
         config (SystemInfoConfig, optional): Command configuration
     """
-    super().__init__(executor)
+    super().__init__(executor, config)
     self.hostname = hostname
-    self.config = config or SystemInfoConfig()
     
-  def collect(self) -> Dict[str, str]:
+  async def collect(self) -> Dict[str, str]:
     """Collect basic system information.
     
     Returns:
         Dict[str, str]: Dictionary containing basic system information
     """
-    return {
-      "hostname": self.hostname,
-      "timestamp": datetime.datetime.now().isoformat(),
-      "uname": self._safe_execute(self.config.uname_command),
-      "os_release": self._safe_execute(self.config.os_release_command),
-      "uptime": self._safe_execute(self.config.uptime_command),
-      "virtualization": self._safe_execute(self.config.virtualization_command),
-      "container_info": self._safe_execute(self.config.container_info_command),
-    }
+    info = host_identity(self.hostname)
+    info.update(await super().collect())
+    return info
 
 #fin
\ No newline at end of file
@@ -3,7 +3,8 @@
 """Hardware information collector."""
 
 from typing import Dict
-from collectors.base import SystemInfoCollector
+from collectors.base import SystemInfoCollector, run_specs
+from collectors.registry import COLLECTOR_SPECS
 from config.system_commands import SystemInfoConfig
 
 class HardwareInfoCollector(SystemInfoCollector):
@@ -13,42 +14,26 @@ class HardwareInfoCollector(SystemInfoCollector):
   components including CPU details, model information, and general hardware listing.
   """
   
-  def __init__(self, executor, config: SystemInfoConfig = None):
+  name = "hardware"
+  
+  def __init__(self, executor, config: SystemInfoConfig = None, deep: bool = False):
     """Initialize the hardware info collector.
     
     Args:
         executor: Command executor instance
         config (SystemInfoConfig, optional): Command configuration
+        deep (bool, optional): Use the full hardware listing instead of the
+            short summary. Defaults to False.
     """
-    super().__init__(executor)
-    self.config = config or SystemInfoConfig()
+    super().__init__(executor, config)
+    self.deep = deep
     
-  def collect(self) -> Dict[str, str]:
+  async def collect(self) -> Dict[str, str]:
     """Collect hardware information.
     
     Returns:
         Dict[str, str]: Dictionary containing hardware information
     """
-    info = {}
-    
-    # Hardware listing with fallback
-    try:
-      hardware_output = self.executor.execute(self.config.hardware_list_command)
-      if not hardware_output.startswith("Error"):
-        info["hardware"] = hardware_output
-      else:
-        info["hardware"] = "lshw not available"
-    except Exception:
-      info["hardware"] = "lshw not available"
-    
-    # CPU information
-    info["cpu_model"] = self._safe_execute(self.config.cpu_model_command)
-    info["cpu_info"] = self._safe_execute(self.config.cpu_info_command)
-    
-    # Memory information
-    info["memory"] = self._safe_execute(self.config.memory_command)
-    info["swap_info"] = self._safe_execute(self.config.swap_info_command)
-    
-    return info
+    return await run_specs(self.executor, self.config, COLLECTOR_SPECS[self.name], self.deep)
 
 #fin
\ No newline at end of file
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+"""Declarative registry of the commands run by each collector.
+
+Collectors are described as data rather than code: each entry maps a
+result key to the SystemInfoConfig attribute holding its command and the
+fallback text used when the command fails. This lets a whole collection
+run be flattened into a single batch (see run_collectors()).
+"""
+
+import re
+from typing import Dict, List, Pattern, Tuple
+
+# (result key, SystemInfoConfig command attribute, fallback message)
+CollectorSpec = Tuple[str, str, str]
+
+COLLECTOR_SPECS: Dict[str, List[CollectorSpec]] = {
+  "basic": [
+    ("uname", "uname_command", "Information not available"),
+    ("os_release", "os_release_command", "Information not available"),
+    ("uptime", "uptime_command", "Information not available"),
+    ("virtualization", "virtualization_command", "Information not available"),
+    ("container_info", "container_info_command", "Information not available"),
+  ],
+  "hardware": [
+    ("hardware", "hardware_list_command", "lshw not available"),
+    ("cpu_model", "cpu_model_command", "Information not available"),
+    ("cpu_info", "cpu_info_command", "Information not available"),
+    ("memory", "memory_command", "Information not available"),
+    ("swap_info", "swap_info_command", "Information not available"),
+  ],
+  "storage": [
+    ("disk_usage", "disk_usage_command", "Information not available"),
+    ("block_devices", "block_devices_command", "lsblk not available"),
+    ("disk_health", "disk_health_command", "Disk health information not available (requires root)"),
+    ("fstab", "fstab_command", "fstab not available"),
+  ],
+  "process": [
+    ("top_cpu_processes", "top_cpu_processes_command", "Information not available"),
+    ("top_mem_processes", "top_mem_processes_command", "Information not available"),
+  ],
+  "network": [
+    ("network_interfaces", "network_interfaces_command", "Network information not available"),
+    ("listening_ports", "listening_ports_command", "Port information not available"),
+  ],
+  "security": [
+    ("failed_services", "failed_services_command", "Failed services information not available"),
+    ("recent_errors", "recent_errors_command", "Error logs not available"),
+    ("auth_failures", "auth_failures_command", "Authentication logs not available"),
+    ("available_updates", "available_updates_command", "Update information not available"),
+    ("rootkit_check", "rootkit_check_command", "Rootkit check logs not available"),
+    ("cron_jobs", "cron_jobs_command", "Crontab information not available"),
+  ],
+}
+
+# What each collected field holds, for the glossary in the Claude prompt
+FIELD_DESCRIPTIONS: Dict[str, str] = {
+  "hostname": "name of the analyzed host",
+  "timestamp": "when the data was collected (ISO 8601, local time of the collecting machine)",
+  "uname": "kernel name, release, version and architecture (uname -a)",
+  "os_release": "distribution name and version (lsb_release -a or /etc/*release)",
+  "uptime": "time since boot, logged-in users and the 1, 5 and 15 minute load averages",
+  "virtualization": "hypervisor or container type from systemd-detect-virt; 'none' means bare metal",
+  "container_info": "first lines of /proc/1/cgroup, which reveal whether PID 1 runs in a container",
+  "hardware": "hardware listing (lshw -short or lspci; with --deep, the full lshw listing "
+              "without per-device configuration lines)",
+  "cpu_model": "CPU model name",
+  "cpu_info": "CPU details from lscpu, including the number of CPUs to compare load averages against",
+  "memory": "RAM and swap in human-readable units (free -h); the 'available' column is memory "
+            "usable without swapping, since buff/cache is reclaimable",
+  "swap_info": "swap devices and files with their size, usage and priority (/proc/swaps)",
+  "disk_usage": "filesystem size, usage and mount points (df -h); read-only loop and snap "
+                "mounts are always 100% full and are not a problem",
+  "block_devices": "disks and partitions with their size, type and mount point (lsblk)",
+  "disk_health": "SMART overall health self-assessment of the first NVMe disk (smartctl -H, needs root)",
+  "fstab": "configured mounts from /etc/fstab, without comments",
+  "top_cpu_processes": "the 10 processes using the most CPU: PID, %CPU, %MEM and command name",
+  "top_mem_processes": "the 10 processes using the most memory: PID, %CPU, %MEM and command name",
+  "network_interfaces": "network interfaces with their state and addresses (ip -br addr)",
+  "listening_ports": "listening TCP and UDP sockets (ss -tuln)",
+  "failed_services": "systemd units in the failed state (systemctl list-units --state=failed)",
+  "recent_errors": "the 20 most recent journal entries of priority err or higher",
+  "auth_failures": "the 20 most recent lines mentioning a failure in /var/log/auth.log",
+  "available_updates": "packages with pending updates (apt list --upgradable, first 20)",
+  "rootkit_check": "the last 200 lines of the daily chkrootkit log",
+  "cron_jobs": "crontab entries of the collecting user, without comments",
+}
+
+# Result keys whose command gets a shorter timeout, mapped to the
+# SystemInfoConfig attribute holding it
+COMMAND_TIMEOUTS: Dict[str, str] = {
+  "hardware": "hardware_list_timeout",
+  "disk_health": "disk_health_timeout",
+  "rootkit_check": "rootkit_check_timeout",
+}
+
+# Commands replaced by a more detailed variant in deep mode (no short timeout
+# applies, and their output is capped at commands.max_deep_output_bytes)
+DEEP_COMMANDS: Dict[str, str] = {
+  "hardware": "hardware_full_list_command",
+}
+
+# Lines removed from deep-mode output; the full lshw listing repeats
+# driver/capability details for every device
+DEEP_FILTERS: Dict[str, Pattern] = {
+  "hardware": re.compile(r"^\s*configuration:.*\n?", re.MULTILINE),
+}
+
+#fin
\ No newline at end of file
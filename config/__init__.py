@@ -5,7 +5,7 @@ for system information collection across different Linux distributions.
 """
 
 from .system_commands import SystemInfoConfig
-from .defaults import DEFAULT_COMMANDS
+from .defaults import get_commands
 from .config_manager import (
     ConfigManager, 
     get_config, 
@@ -14,15 +14,20 @@ from .config_manager import (
     get_default_language,
     get_output_directory,
     get_command_timeout,
+    get_max_output_bytes,
+    get_max_deep_output_bytes,
     get_claude_timeout,
     get_log_format,
     get_smtp_settings,
-    get_report_thresholds
+    get_report_thresholds,
+    get_output_settings,
+    get_email_settings
 )
 
 __all__ = [
   "SystemInfoConfig",
   "DEFAULT_COMMANDS",
+  "get_commands",
   "ConfigManager",
   "get_config",
   "reload_config",
@@ -30,10 +35,21 @@ __all__ = [
   "get_default_language", 
   "get_output_directory",
   "get_command_timeout",
+  "get_max_output_bytes",
+  "get_max_deep_output_bytes",
   "get_claude_timeout",
   "get_log_format",
   "get_smtp_settings",
-  "get_report_thresholds"
+  "get_report_thresholds",
+  "get_output_settings",
+  "get_email_settings"
 ]
 
+def __getattr__(name: str):
+  """Resolve DEFAULT_COMMANDS lazily from config.defaults (PEP 562)."""
+  if name == "DEFAULT_COMMANDS":
+    value = globals()[name] = get_commands(None)
+    return value
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 #fin
\ No newline at end of file
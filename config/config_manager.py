@@ -8,16 +8,54 @@ This module provides centralized configuration management with support for:
 - Default fallback values
 - Type validation and conversion
 - Nested configuration access
+
+YAML is parsed with PyYAML's libyaml-backed CSafeLoader when PyYAML was
+built against libyaml (the libyaml system package); otherwise the
+pure-Python SafeLoader is used. The parsed file is also cached as JSON
+under ~/.cache/syshealth/config and reused until the YAML file changes,
+so most runs skip YAML parsing entirely. JSON is data-only, so a cache
+file planted by another user cannot execute code (e.g. under sudo).
 """
 
+import functools
+import hashlib
+import json
 import os
+import re
+import tempfile
+import threading
 import yaml
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple, Union
 import logging
 
 logger = logging.getLogger("syshealth.config")
 
+# Parse YAML in C when libyaml is available
+try:
+  from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+  from yaml import SafeLoader as _YamlLoader
+
+# syshealth.yaml alongside this module (config/syshealth.yaml in the project)
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "syshealth.yaml")
+
+# Prefix of environment variables that override configuration values
+ENV_PREFIX = "SYSHEALTH_"
+
+# Boolean spellings accepted in environment overrides
+_BOOL_VALUES = {
+  'true': True, 'yes': True, '1': True, 'on': True,
+  'false': False, 'no': False, '0': False, 'off': False,
+}
+
+# Integers, or decimals (with optional exponent) that contain a '.'
+_NUMBER_RE = re.compile(r"^\s*(?:(?P<int>[+-]?\d+)|[+-]?(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?)\s*$")
+
+# Directory holding JSON copies of parsed configuration files
+CONFIG_CACHE_DIR = "~/.cache/syshealth/config"
+
 
 class ConfigManager:
   """Manages SysHealth configuration from multiple sources.
@@ -42,12 +80,16 @@ class ConfigManager:
     """
     self._config = {}
     self._config_path = config_path
+    self._flat: Dict[str, Any] = {}
+    self._env_snapshot: Optional[tuple] = None
+    self._env_overrides: List[Tuple[str, Any]] = []
+    self._file_signature: Optional[tuple] = None
+    self._modified = False
     self._load_config()
   
   def _get_default_config_path(self) -> str:
     """Get the default configuration file path."""
-    script_dir = Path(__file__).parent.parent
-    return str(script_dir / "config" / "syshealth.yaml")
+    return DEFAULT_CONFIG_PATH
   
   def _load_config(self):
     """Load configuration from file and environment variables."""
@@ -60,22 +102,129 @@ class ConfigManager:
     
     # Apply environment variable overrides
     self._apply_env_overrides()
+    self._rebuild_index()
+  
+  def _rebuild_index(self):
+    """Index every section and value by its dotted path.
+    
+    Called whenever the configuration changes, so get() and has() are a
+    single dict lookup regardless of nesting depth.
+    """
+    self._flat = {}
+    self._flatten("", self._config)
+    _clear_accessor_caches()
+  
+  def _flatten(self, prefix: str, section: Dict[str, Any]):
+    """Add a section's entries, and those of nested sections, to the index.
+    
+    Args:
+        prefix (str): Dotted path of the section ("" for the root)
+        section (Dict[str, Any]): The section to index
+    """
+    for key, value in section.items():
+      path = f"{prefix}{key}"
+      self._flat[path] = value
+      if isinstance(value, dict):
+        self._flatten(f"{path}.", value)
   
   def _load_yaml_config(self):
     """Load configuration from YAML file."""
     try:
       config_path = Path(self._config_path)
-      if config_path.exists():
-        with open(config_path, 'r') as f:
-          self._config = yaml.safe_load(f) or {}
-        logger.debug(f"Loaded configuration from {config_path}")
+      signature = self._stat_config_file()
+      self._file_signature = signature
+      if signature is not None:
+        cached = self._read_config_cache(signature)
+        if cached is not None:
+          self._config = cached
+          logger.debug("Loaded cached configuration for %s", config_path)
+          return
+        
+        with open(config_path, 'rb') as f:
+          self._config = yaml.load(f.read(), Loader=_YamlLoader) or {}
+        logger.debug("Loaded configuration from %s", config_path)
+        self._write_config_cache(signature, self._config)
       else:
-        logger.warning(f"Configuration file not found: {config_path}")
+        logger.warning("Configuration file not found: %s", config_path)
         self._config = {}
     except Exception as e:
-      logger.error(f"Failed to load configuration file: {e}")
+      logger.error("Failed to load configuration file: %s", e)
       self._config = {}
   
+  def _stat_config_file(self) -> Optional[tuple]:
+    """Get the (mtime_ns, size) signature of the YAML file, or None if it is missing."""
+    try:
+      stat = os.stat(self._config_path)
+    except OSError:
+      return None
+    return (stat.st_mtime_ns, stat.st_size)
+  
+  @staticmethod
+  def _env_items() -> tuple:
+    """Get the SYSHEALTH_* environment variables as a sorted tuple of items.
+    
+    Only the keys are scanned; values, which os.environ decodes on every
+    access, are read for matching variables only.
+    """
+    environ = os.environ
+    return tuple(sorted(
+      (env_key, environ[env_key]) for env_key in environ
+      if env_key.startswith(ENV_PREFIX)
+    ))
+  
+  def _config_cache_path(self) -> str:
+    """Get the JSON cache path for the current configuration file."""
+    key = hashlib.sha1(os.path.abspath(self._config_path).encode()).hexdigest()
+    return os.path.join(os.path.expanduser(CONFIG_CACHE_DIR), f"{key}.json")
+  
+  def _read_config_cache(self, signature: tuple) -> Optional[Dict[str, Any]]:
+    """Read the parsed configuration from the JSON cache.
+    
+    Args:
+        signature (tuple): (mtime_ns, size) of the YAML file
+        
+    Returns:
+        Optional[Dict[str, Any]]: The cached configuration, or None if it is
+            missing, unreadable, or was built from a different version of the file
+    """
+    try:
+      with open(self._config_cache_path(), 'r', encoding='utf-8') as f:
+        cached = json.load(f)
+      cached_signature, config = cached["signature"], cached["config"]
+    except Exception:
+      return None
+    if cached_signature != list(signature) or not isinstance(config, dict):
+      return None
+    return config
+  
+  def _write_config_cache(self, signature: tuple, config: Dict[str, Any]):
+    """Atomically write the parsed configuration to the JSON cache.
+    
+    Configurations that do not survive a JSON round trip unchanged (e.g.
+    YAML dates or non-string keys) are not cached.
+    
+    Args:
+        signature (tuple): (mtime_ns, size) of the YAML file
+        config (Dict[str, Any]): The parsed configuration
+    """
+    cache_path = self._config_cache_path()
+    try:
+      text = json.dumps({"signature": list(signature), "config": config})
+      if json.loads(text)["config"] != config:
+        logger.debug("Configuration is not JSON-serializable as is; not caching it")
+        return
+      os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+      fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+      try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+          f.write(text)
+        os.replace(tmp_path, cache_path)
+      except BaseException:
+        os.unlink(tmp_path)
+        raise
+    except Exception as e:
+      logger.debug("Failed to write configuration cache %s: %s", cache_path, e)
+  
   def _apply_env_overrides(self):
     """Apply environment variable overrides to configuration.
     
@@ -83,22 +232,23 @@ class ConfigManager:
     Examples:
       SYSHEALTH_CLAUDE_MODEL overrides claude.model
       SYSHEALTH_OUTPUT_DEFAULT_DIRECTORY overrides output.default_directory
+    
+    The parsed overrides are kept and reused on reload while the
+    SYSHEALTH_* variables are unchanged.
     """
-    env_prefix = "SYSHEALTH_"
+    snapshot = self._env_items()
+    if snapshot != self._env_snapshot:
+      prefix_length = len(ENV_PREFIX)
+      self._env_overrides = [
+        # Convert the variable name to a config path and the value to its type
+        (env_key[prefix_length:].lower().replace('_', '.'), self._convert_env_value(env_value))
+        for env_key, env_value in snapshot
+      ]
+      self._env_snapshot = snapshot
     
-    for env_key, env_value in os.environ.items():
-      if not env_key.startswith(env_prefix):
-        continue
-      
-      # Convert environment variable name to config path
-      config_path = env_key[len(env_prefix):].lower().replace('_', '.')
-      
-      # Convert string value to appropriate type
-      converted_value = self._convert_env_value(env_value)
-      
-      # Set the configuration value
+    for config_path, converted_value in self._env_overrides:
       self._set_nested_value(config_path, converted_value)
-      logger.debug(f"Applied environment override: {config_path} = {converted_value}")
+      logger.debug("Applied environment override: %s = %s", config_path, converted_value)
   
   def _convert_env_value(self, value: str) -> Any:
     """Convert environment variable string to appropriate type.
@@ -110,19 +260,14 @@ class ConfigManager:
         Any: Converted value (bool, int, float, or str)
     """
     # Handle boolean values
-    if value.lower() in ('true', 'yes', '1', 'on'):
-      return True
-    elif value.lower() in ('false', 'no', '0', 'off'):
-      return False
+    boolean = _BOOL_VALUES.get(value.lower())
+    if boolean is not None:
+      return boolean
     
     # Handle numeric values
-    try:
-      if '.' in value:
-        return float(value)
-      else:
-        return int(value)
-    except ValueError:
-      pass
+    match = _NUMBER_RE.match(value)
+    if match:
+      return int(value) if match.group('int') else float(value)
     
     # Return as string
     return value
@@ -156,26 +301,19 @@ class ConfigManager:
     Returns:
         Any: Configuration value or default
     """
-    keys = path.split('.')
-    current = self._config
-    
-    try:
-      for key in keys:
-        current = current[key]
-      return current
-    except (KeyError, TypeError):
-      return default
+    return self._flat.get(path, default)
   
   def get_section(self, section: str) -> Dict[str, Any]:
     """Get an entire configuration section.
     
     Args:
-        section (str): Section name (e.g., 'claude')
+        section (str): Section name or dotted path (e.g., 'claude', 'email.smtp')
         
     Returns:
         Dict[str, Any]: Configuration section or empty dict
     """
-    return self._config.get(section, {})
+    value = self._flat.get(section)
+    return value if isinstance(value, dict) else {}
   
   def set(self, path: str, value: Any):
     """Set a configuration value using dot notation.
@@ -185,6 +323,8 @@ class ConfigManager:
         value (Any): Value to set
     """
     self._set_nested_value(path, value)
+    self._rebuild_index()
+    self._modified = True
   
   def has(self, path: str) -> bool:
     """Check if a configuration path exists.
@@ -195,15 +335,7 @@ class ConfigManager:
     Returns:
         bool: True if path exists, False otherwise
     """
-    keys = path.split('.')
-    current = self._config
-    
-    try:
-      for key in keys:
-        current = current[key]
-      return True
-    except (KeyError, TypeError):
-      return False
+    return path in self._flat
   
   def expand_path(self, path: str) -> str:
     """Expand a file path with user home directory and environment variables.
@@ -237,8 +369,19 @@ class ConfigManager:
     return self.expand_path(config_path)
   
   def reload(self):
-    """Reload configuration from file and environment variables."""
+    """Reload configuration from file and environment variables.
+    
+    This is a no-op costing a single stat() when the file and the
+    SYSHEALTH_* environment variables are unchanged and set() has not
+    been called since the last load.
+    """
+    if (not self._modified
+        and self._stat_config_file() == self._file_signature
+        and self._env_items() == self._env_snapshot):
+      logger.debug("Configuration unchanged, skipping reload")
+      return
     self._load_config()
+    self._modified = False
   
   def to_dict(self) -> Dict[str, Any]:
     """Get the entire configuration as a dictionary.
@@ -259,66 +402,169 @@ class ConfigManager:
 
 # Global configuration instance
 _global_config = None
+_global_config_lock = threading.Lock()
 
 
 def get_config() -> ConfigManager:
   """Get the global configuration instance.
   
+  After the first call this is a lock-free read of the current instance,
+  which a background reload may replace at any time.
+  
   Returns:
       ConfigManager: Global configuration instance
   """
   global _global_config
-  if _global_config is None:
-    _global_config = ConfigManager()
-  return _global_config
+  config = _global_config
+  if config is None:
+    with _global_config_lock:
+      if _global_config is None:
+        _global_config = ConfigManager()
+      config = _global_config
+  return config
+
+
+def _refresh_global_config(config_path: str):
+  """Load a fresh configuration and swap it in as the global instance.
+  
+  Args:
+      config_path (str): Path of the configuration file to load
+  """
+  global _global_config
+  try:
+    fresh = ConfigManager(config_path)
+  except Exception as e:
+    logger.error("Background configuration reload failed: %s", e)
+    return
+  with _global_config_lock:
+    _global_config = fresh
+  _clear_accessor_caches()
 
 
-def reload_config():
-  """Reload the global configuration."""
+def reload_config(background: bool = False) -> Optional[threading.Thread]:
+  """Reload the global configuration.
+  
+  Args:
+      background (bool): Keep serving the current configuration while a
+          fresh one is loaded in a daemon thread, then swap it in
+          (stale-while-revalidate). Defaults to False, which reloads in place.
+  
+  Returns:
+      Optional[threading.Thread]: The refresh thread when background is True
+  """
   global _global_config
-  if _global_config is not None:
-    _global_config.reload()
+  config = _global_config
+  if config is None:
+    return None
+  
+  if background:
+    thread = threading.Thread(
+      target=_refresh_global_config, args=(config._config_path,), daemon=True
+    )
+    thread.start()
+    return thread
+  
+  config.reload()
+  _clear_accessor_caches()
+  return None
 
 
 # Convenience functions for common configuration values
+@functools.lru_cache(maxsize=None)
 def get_claude_model() -> str:
   """Get the Claude model name."""
   return get_config().get('claude.model', 'claude-3-7-sonnet-20250219')
 
 
+@functools.lru_cache(maxsize=None)
 def get_default_language() -> str:
   """Get the default report language."""
   return get_config().get('language.default', 'en')
 
 
+@functools.lru_cache(maxsize=None)
 def get_output_directory() -> str:
   """Get the default output directory (expanded)."""
   return get_config().get_expanded_path('output.default_directory', '~/syshealth')
 
 
+@functools.lru_cache(maxsize=None)
 def get_command_timeout() -> int:
   """Get the default command timeout."""
   return get_config().get('commands.timeout', 30)
 
 
+@functools.lru_cache(maxsize=None)
+def get_max_output_bytes() -> int:
+  """Get the number of bytes kept from the end of each command output."""
+  return int(get_config().get('commands.max_output_bytes', 8192))
+
+
+@functools.lru_cache(maxsize=None)
+def get_max_deep_output_bytes() -> int:
+  """Get the number of bytes kept from the end of each --deep command output."""
+  return int(get_config().get('commands.max_deep_output_bytes', 262144))
+
+
+@functools.lru_cache(maxsize=None)
 def get_claude_timeout() -> int:
   """Get the Claude API timeout."""
   return get_config().get('claude.timeout', 300)
 
 
+@functools.lru_cache(maxsize=None)
 def get_log_format() -> str:
   """Get the logging format string."""
   return get_config().get('logging.format', '%(asctime)s - %(levelname)s - %(message)s')
 
 
+@functools.lru_cache(maxsize=None)
 def get_smtp_settings() -> Dict[str, Any]:
   """Get SMTP configuration settings."""
   return get_config().get_section('email.smtp')
 
 
+@functools.lru_cache(maxsize=None)
 def get_report_thresholds() -> Dict[str, Any]:
   """Get report threshold settings."""
   return get_config().get_section('report.thresholds')
 
 
+@functools.lru_cache(maxsize=None)
+def get_output_settings() -> SimpleNamespace:
+  """Get the report and debug file naming settings."""
+  config = get_config()
+  return SimpleNamespace(
+    timestamp_format=config.get('output.timestamp_format', '%Y%m%d-%H%M%S'),
+    report_extension=config.get('output.file_extensions.report', '.md'),
+    debug_extension=config.get('output.file_extensions.debug', '.txt'),
+    summary_extension=config.get('output.file_extensions.summary', '.json'),
+    debug_subdirectory=config.get('output.debug_subdirectory', 'debug'),
+    data_subdirectory=config.get('output.data_subdirectory', 'data')
+  )
+
+
+@functools.lru_cache(maxsize=None)
+def get_email_settings() -> SimpleNamespace:
+  """Get the email sender, subject and SMTP server settings."""
+  config = get_config()
+  return SimpleNamespace(
+    sender_name=config.get('email.sender.name', 'SysHealth'),
+    domain_suffix=config.get('email.sender.domain_suffix', '@hostname'),
+    subject_template=config.get('email.subject_template', 'System Health Report for {hostname}'),
+    smtp_host=config.get('email.smtp.host', 'localhost'),
+    smtp_port=config.get('email.smtp.port', 25),
+    smtp_timeout=config.get('email.smtp.timeout', 30)
+  )
+
+
+def _clear_accessor_caches():
+  """Clear the memoized results of the convenience functions above."""
+  for accessor in (get_claude_model, get_default_language, get_output_directory,
+                   get_command_timeout, get_max_output_bytes, get_max_deep_output_bytes,
+                   get_claude_timeout, get_log_format, get_smtp_settings,
+                   get_report_thresholds, get_output_settings, get_email_settings):
+    accessor.cache_clear()
+
+
 #fin
\ No newline at end of file
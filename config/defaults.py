@@ -1,15 +1,50 @@
 #!/usr/bin/env python3
 
-"""Default command configurations for system information collection."""
+"""Default command configurations for system information collection.
+
+Configurations are built on first use rather than at import time, since a
+run only ever needs one of them. The module attributes DEFAULT_COMMANDS,
+UBUNTU_COMMANDS, CENTOS_COMMANDS and ARCH_COMMANDS are still available
+and resolve through get_commands().
+"""
+
+import functools
+from typing import Optional
 
 from config.system_commands import SystemInfoConfig
 
-# Default configuration instance for Ubuntu/Debian systems
-DEFAULT_COMMANDS = SystemInfoConfig()
+# Module attributes that resolve to a distribution configuration on first access
+_DISTRIBUTION_ATTRIBUTES = {
+  # Default configuration instance for Ubuntu/Debian systems
+  "DEFAULT_COMMANDS": None,
+  # Distribution-specific configurations can be added here as needed
+  "UBUNTU_COMMANDS": "ubuntu",
+  "CENTOS_COMMANDS": "centos",
+  "ARCH_COMMANDS": "arch",
+}
+
+@functools.lru_cache(maxsize=None)
+def get_commands(distro: Optional[str] = None) -> SystemInfoConfig:
+  """Get the shared command configuration for a distribution.
+  
+  Args:
+      distro (Optional[str]): The distribution name, or None for the defaults
+      
+  Returns:
+      SystemInfoConfig: Configuration instance, created on the first call
+  """
+  return SystemInfoConfig.for_distribution(distro)
 
-# Distribution-specific configurations can be added here as needed
-UBUNTU_COMMANDS = SystemInfoConfig.for_distribution("ubuntu")
-CENTOS_COMMANDS = SystemInfoConfig.for_distribution("centos") 
-ARCH_COMMANDS = SystemInfoConfig.for_distribution("arch")
+def __getattr__(name: str) -> SystemInfoConfig:
+  """Resolve the *_COMMANDS module attributes lazily (PEP 562).
+  
+  The instance is stored as a real module attribute, so later accesses
+  are plain attribute lookups.
+  """
+  if name in _DISTRIBUTION_ATTRIBUTES:
+    value = get_commands(_DISTRIBUTION_ATTRIBUTES[name])
+    globals()[name] = value
+    return value
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 #fin
\ No newline at end of file
@@ -2,15 +2,21 @@
 
 """System command configuration management."""
 
+import functools
+import sys
 from dataclasses import dataclass
 from typing import Dict, Optional
 
-@dataclass
+# __slots__ keeps instances small, but dataclass(slots=) needs Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_SLOTS)
 class SystemInfoConfig:
   """Configuration class for system information collection commands.
   
   This class centralizes all command definitions used for system information
   collection, allowing for easy customization and distribution-specific overrides.
+  Instances are immutable; use ``dataclasses.replace()`` to derive a variant.
   """
   
   # Basic system information commands
@@ -19,7 +25,8 @@ class SystemInfoConfig:
   uptime_command: str = "uptime"
   
   # Hardware information commands
-  hardware_list_command: str = "lshw -short 2>/dev/null || echo 'Hardware listing unavailable (install: sudo apt install lshw)'"
+  hardware_list_command: str = "lshw -short -quiet 2>/dev/null || lspci -mm 2>/dev/null || echo 'Hardware listing unavailable (install: sudo apt install lshw)'"
+  hardware_full_list_command: str = "lshw -quiet 2>/dev/null || echo 'Hardware listing unavailable (install: sudo apt install lshw)'"
   cpu_model_command: str = "lscpu | grep 'Model name' 2>/dev/null || grep -i cpu /proc/cpuinfo | grep -i model | head -1"
   cpu_info_command: str = "lscpu 2>/dev/null || cat /proc/cpuinfo || echo 'CPU information unavailable (install: sudo apt install util-linux)'"
   
@@ -43,38 +50,50 @@ class SystemInfoConfig:
   
   # System health commands
   failed_services_command: str = "timeout 15s systemctl list-units --state=failed 2>/dev/null || echo 'Failed services information not available'"
-  recent_errors_command: str = "timeout 30s journalctl -p err --lines=20 --no-pager -q 2>/dev/null || echo 'Error logs not available'"
-  auth_failures_command: str = "grep -i fail /var/log/auth.log 2>/dev/null | tail -20 || echo 'Authentication logs not available'"
+  # Log and update commands print an explicit marker when they ran but found
+  # nothing, so empty output always means the data could not be collected
+  recent_errors_command: str = "_out=$(timeout 30s journalctl -p err --lines=20 --no-pager -q 2>/dev/null) && { [ -n \"$_out\" ] && printf '%s\\n' \"$_out\" || echo '-- No entries --'; } || echo 'Error logs not available'"
+  auth_failures_command: str = "[ -r /var/log/auth.log ] && { grep -i fail /var/log/auth.log | tail -20 | grep . || echo '-- No entries --'; } || echo 'Authentication logs not available'"
   
   # Security and maintenance commands
-  available_updates_command: str = "apt list --upgradable 2>/dev/null | head -20 || echo 'Update information not available'"
-  rootkit_check_command: str = "cat /var/log/chkrootkit/log.today 2>/dev/null || echo 'Rootkit check logs not available (install: sudo apt install chkrootkit)'"
+  available_updates_command: str = "command -v apt >/dev/null && apt list --upgradable 2>/dev/null | head -20 || echo 'Update information not available'"
+  rootkit_check_command: str = "tail -n 200 /var/log/chkrootkit/log.today 2>/dev/null || echo 'Rootkit check logs not available (install: sudo apt install chkrootkit)'"
   cron_jobs_command: str = "crontab -l | grep -vE '^(#|$)' 2>/dev/null || echo 'Crontab information not available'"
   
   # Virtualization and container detection commands  
   virtualization_command: str = "systemd-detect-virt 2>/dev/null || dmesg | grep -i hypervisor | head -5 2>/dev/null || echo 'Virtualization info not available (install: sudo apt install systemd)'"
   container_info_command: str = "cat /proc/1/cgroup 2>/dev/null | head -5 || echo 'Container information not available'"
   
+  # Per-command timeouts (seconds) for commands that can hang; others use commands.timeout
+  hardware_list_timeout: int = 10
+  disk_health_timeout: int = 15
+  rootkit_check_timeout: int = 5
+  
   @classmethod
+  @functools.lru_cache(maxsize=None)
   def for_distribution(cls, distro: Optional[str] = None) -> "SystemInfoConfig":
     """Create a configuration instance optimized for a specific Linux distribution.
     
+    Instances are cached, so repeated calls for a distribution share one.
+    
     Args:
         distro (Optional[str]): The distribution name (e.g., 'ubuntu', 'centos', 'debian')
         
     Returns:
         SystemInfoConfig: Configuration instance with distribution-specific optimizations
     """
-    config = cls()
+    overrides: Dict[str, str] = {}
     
     if distro and distro.lower() in ['centos', 'rhel', 'fedora']:
       # Red Hat-based distributions use different package management
-      config.available_updates_command = "yum check-update 2>/dev/null | head -20 || dnf check-update 2>/dev/null | head -20 || echo 'Update information not available'"
-      config.os_release_command = "cat /etc/redhat-release 2>/dev/null || cat /etc/*release 2>/dev/null"
+      overrides["available_updates_command"] = "_pm=$(command -v dnf || command -v yum) && { \"$_pm\" check-update 2>/dev/null | head -20 | grep . || echo 'No pending updates'; } || echo 'Update information not available'"
+      overrides["os_release_command"] = "cat /etc/redhat-release 2>/dev/null || cat /etc/*release 2>/dev/null"
     elif distro and distro.lower() in ['arch', 'manjaro']:
       # Arch-based distributions use pacman
-      config.available_updates_command = "pacman -Qu 2>/dev/null | head -20 || echo 'Update information not available'"
+      overrides["available_updates_command"] = "command -v pacman >/dev/null && { pacman -Qu 2>/dev/null | head -20 | grep . || echo 'No pending updates'; } || echo 'Update information not available'"
     
-    return config
+    # Field defaults are already shared by every instance; interning the
+    # overrides makes equal commands from different configs share one object
+    return cls(**{name: sys.intern(command) for name, command in overrides.items()})
 
 #fin
\ No newline at end of file
@@ -7,11 +7,13 @@ and remotely, enabling dependency injection and easier testing.
 from .base import CommandExecutor
 from .local import LocalCommandExecutor
 from .remote import RemoteCommandExecutor
+from .caching import CachingCommandExecutor
 
 __all__ = [
   "CommandExecutor",
   "LocalCommandExecutor", 
   "RemoteCommandExecutor",
+  "CachingCommandExecutor",
 ]
 
 #fin
\ No newline at end of file
@@ -2,8 +2,16 @@
 
 """Base command executor protocol for dependency injection."""
 
-from abc import ABC, abstractmethod
-from typing import Protocol
+import asyncio
+import re
+import shlex
+import uuid
+from typing import List, Optional, Protocol, Tuple
+
+from config import get_command_timeout, get_max_deep_output_bytes, get_max_output_bytes
+
+# Extra seconds a whole batch may take beyond its slowest command's timeout
+BATCH_TIMEOUT_GRACE = 10
 
 class CommandExecutor(Protocol):
   """Protocol for command execution abstraction.
@@ -12,15 +20,192 @@ class CommandExecutor(Protocol):
   enabling dependency injection and easier testing through mocking.
   """
   
-  def execute(self, command: str) -> str:
+  def execute(self, command: str, timeout: Optional[float] = None) -> str:
     """Execute a command and return its output.
     
     Args:
         command (str): The command to execute
+        timeout (Optional[float]): Seconds before the command is killed;
+            defaults to get_command_timeout()
         
     Returns:
         str: The command output or error message
     """
     ...
+  
+  async def execute_async(self, command: str, timeout: Optional[float] = None) -> str:
+    """Execute a command without blocking the event loop.
+    
+    Args:
+        command (str): The command to execute
+        timeout (Optional[float]): Seconds before the command is killed;
+            defaults to get_command_timeout()
+        
+    Returns:
+        str: The command output or error message
+    """
+    ...
+  
+  def execute_batch(self, commands: List[str],
+                    timeouts: Optional[List[Optional[float]]] = None) -> List[str]:
+    """Execute several commands in a single shell invocation.
+    
+    Args:
+        commands (List[str]): The commands to execute
+        timeouts (Optional[List[Optional[float]]]): Per-command timeouts in
+            seconds; None entries use get_command_timeout()
+        
+    Returns:
+        List[str]: The output or error message of each command, in order
+    """
+    ...
+  
+  async def execute_batch_async(self, commands: List[str],
+                                timeouts: Optional[List[Optional[float]]] = None) -> List[str]:
+    """Execute several commands in a single shell invocation without blocking.
+    
+    Args:
+        commands (List[str]): The commands to execute
+        timeouts (Optional[List[Optional[float]]]): Per-command timeouts in
+            seconds; None entries use get_command_timeout()
+        
+    Returns:
+        List[str]: The output or error message of each command, in order
+    """
+    ...
+
+
+def resolve_timeout(timeout: Optional[float]) -> float:
+  """Get the timeout to apply to a command.
+  
+  Args:
+      timeout (Optional[float]): Requested timeout in seconds, or None
+      
+  Returns:
+      float: The requested timeout, or the configured default command timeout
+  """
+  return timeout if timeout is not None else get_command_timeout()
+
+
+def resolve_timeouts(count: int, timeouts: Optional[List[Optional[float]]] = None) -> List[float]:
+  """Get the timeout to apply to each command of a batch.
+  
+  Args:
+      count (int): Number of commands in the batch
+      timeouts (Optional[List[Optional[float]]]): Requested per-command timeouts
+      
+  Returns:
+      List[float]: One timeout per command, with defaults filled in
+  """
+  timeouts = list(timeouts or [])
+  timeouts += [None] * (count - len(timeouts))
+  return [resolve_timeout(timeout) for timeout in timeouts[:count]]
+
+
+async def communicate(process: asyncio.subprocess.Process, input: Optional[bytes] = None,
+                      timeout: Optional[float] = None) -> Tuple[bytes, bytes]:
+  """Wait for a subprocess to finish, killing it if it exceeds a timeout.
+  
+  Args:
+      process (asyncio.subprocess.Process): The running process
+      input (Optional[bytes]): Data to send to the process's stdin
+      timeout (Optional[float]): Seconds to wait before killing the process
+      
+  Returns:
+      Tuple[bytes, bytes]: The process's stdout and stderr
+      
+  Raises:
+      TimeoutError: If the process did not finish in time
+  """
+  try:
+    return await asyncio.wait_for(process.communicate(input), timeout)
+  except asyncio.TimeoutError:
+    process.kill()
+    await process.wait()
+    raise TimeoutError(f"timed out after {timeout}s")
+
+
+def truncate_output(output: str, max_bytes: Optional[int] = None) -> str:
+  """Keep only the end of a command output, where the most recent lines are.
+  
+  Args:
+      output (str): Command output
+      max_bytes (Optional[int]): Bytes to keep; defaults to get_max_output_bytes()
+      
+  Returns:
+      str: The output, or its last max_bytes bytes preceded by a marker
+  """
+  max_bytes = max_bytes or get_max_output_bytes()
+  encoded = output.encode()
+  if len(encoded) <= max_bytes:
+    return output
+  return "...[truncated]...\n" + encoded[-max_bytes:].decode(errors="ignore")
+
+
+def build_batch_script(commands: List[str],
+                       timeouts: Optional[List[Optional[float]]] = None) -> Tuple[str, str]:
+  """Build a bash script that runs commands concurrently and delimits their output.
+  
+  Each command runs in its own background ``bash -c`` under ``timeout``,
+  with output captured to a temporary directory. Once all have finished,
+  the script prints a marker line (``<marker> <index> <exit status>``) per
+  command followed by its stdout, or its stderr if it exited non-zero. A
+  command that times out exits with status 124 and is reported as an error.
+  
+  Each section is limited on the executing host to the larger of the two
+  output caps (get_max_output_bytes() and, for --deep commands,
+  get_max_deep_output_bytes()), so a runaway command cannot inflate the
+  batch output transferred and buffered in memory; truncate_output()
+  then applies the cap of each field.
+  
+  Args:
+      commands (List[str]): The commands to execute
+      timeouts (Optional[List[Optional[float]]]): Per-command timeouts in
+          seconds; None entries use get_command_timeout()
+      
+  Returns:
+      Tuple[str, str]: The script text and the unique output marker
+  """
+  marker = f"__SYSHEALTH_{uuid.uuid4().hex}__"
+  max_bytes = max(get_max_output_bytes(), get_max_deep_output_bytes())
+  lines = ['_sh_dir=$(mktemp -d) || exit 1']
+  for index, (command, timeout) in enumerate(zip(commands, resolve_timeouts(len(commands), timeouts))):
+    lines.append(
+      f'{{ timeout -k 2 {timeout:g} bash -c {shlex.quote(command)} '
+      f'</dev/null >"$_sh_dir/{index}.out" 2>"$_sh_dir/{index}.err"; '
+      f'echo $? >"$_sh_dir/{index}.rc"; }} &'
+    )
+  lines.append('wait')
+  lines.append(f'for _sh_i in {" ".join(str(i) for i in range(len(commands)))}; do')
+  lines.append('  _sh_rc=$(cat "$_sh_dir/$_sh_i.rc" 2>/dev/null || echo 1)')
+  lines.append(f"  printf '%s %s %s\\n' '{marker}' \"$_sh_i\" \"$_sh_rc\"")
+  lines.append('  if [ "$_sh_rc" = 0 ]; then _sh_f="$_sh_dir/$_sh_i.out"; else _sh_f="$_sh_dir/$_sh_i.err"; fi')
+  # One extra byte lets truncate_output() see that the output was cut
+  lines.append(f'  tail -c {max_bytes + 1} "$_sh_f"')
+  lines.append('done')
+  lines.append('rm -rf "$_sh_dir"')
+  return "\n".join(lines) + "\n", marker
+
+
+def parse_batch_output(output: str, marker: str, count: int, error: str = "") -> List[str]:
+  """Split the output of a batch script into per-command results.
+  
+  Args:
+      output (str): Standard output of the batch script
+      marker (str): The marker returned by build_batch_script
+      count (int): Number of commands in the batch
+      error (str): Error text to report for commands with no output section
+      
+  Returns:
+      List[str]: Per-command output, or an ``Error: ...`` message for commands
+          that exited non-zero or produced no section
+  """
+  results = [f"Error: {error}"] * count
+  parts = re.split(re.escape(marker) + r" (\d+) (\d+)\n", output)
+  for i in range(1, len(parts) - 2, 3):
+    index, returncode, text = int(parts[i]), int(parts[i + 1]), parts[i + 2]
+    if index < count:
+      results[index] = text if returncode == 0 else f"Error: {text}"
+  return results
 
 #fin
\ No newline at end of file
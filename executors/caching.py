@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+"""Caching command executor wrapper."""
+
+import logging
+from typing import Dict, List, Optional
+
+from executors.base import CommandExecutor
+
+logger = logging.getLogger("syshealth.executors.caching")
+
+class CachingCommandExecutor:
+  """Memoizes command output from another executor for the duration of a run.
+  
+  Wrapping an executor lets several collectors issue the same command
+  while only running it once. Create a new instance (or call clear_cache())
+  for each collection run so results never go stale between runs.
+  """
+  
+  def __init__(self, executor: CommandExecutor):
+    """Initialize the caching executor.
+    
+    Args:
+        executor (CommandExecutor): The executor that actually runs commands
+    """
+    self.executor = executor
+    self._cache: Dict[str, str] = {}
+  
+  def clear_cache(self):
+    """Discard all memoized command output."""
+    self._cache.clear()
+  
+  def execute(self, command: str, timeout: Optional[float] = None, bypass_cache: bool = False) -> str:
+    """Execute a command, reusing earlier output for the same command.
+    
+    Args:
+        command (str): The command to execute
+        timeout (Optional[float]): Seconds before the command is killed
+        bypass_cache (bool): Always run the command, e.g. for output that
+            must be fresh
+        
+    Returns:
+        str: The command output or error message
+    """
+    if not bypass_cache and command in self._cache:
+      return self._cache[command]
+    result = self.executor.execute(command, timeout)
+    self._cache[command] = result
+    return result
+  
+  async def execute_async(self, command: str, timeout: Optional[float] = None,
+                          bypass_cache: bool = False) -> str:
+    """Execute a command without blocking, reusing earlier output for the same command.
+    
+    Args:
+        command (str): The command to execute
+        timeout (Optional[float]): Seconds before the command is killed
+        bypass_cache (bool): Always run the command
+        
+    Returns:
+        str: The command output or error message
+    """
+    if not bypass_cache and command in self._cache:
+      return self._cache[command]
+    result = await self.executor.execute_async(command, timeout)
+    self._cache[command] = result
+    return result
+  
+  def execute_batch(self, commands: List[str], timeouts: Optional[List[Optional[float]]] = None,
+                    bypass_cache: bool = False) -> List[str]:
+    """Execute a batch of commands, running only those not already cached.
+    
+    Args:
+        commands (List[str]): The commands to execute
+        timeouts (Optional[List[Optional[float]]]): Per-command timeouts in seconds
+        bypass_cache (bool): Always run every command
+        
+    Returns:
+        List[str]: The output or error message of each command, in order
+    """
+    pending = self._pending(commands, bypass_cache)
+    if pending:
+      results = self.executor.execute_batch(pending, self._pending_timeouts(commands, timeouts, pending))
+      self._cache.update(zip(pending, results))
+    return [self._cache[command] for command in commands]
+  
+  async def execute_batch_async(self, commands: List[str],
+                                timeouts: Optional[List[Optional[float]]] = None,
+                                bypass_cache: bool = False) -> List[str]:
+    """Execute a batch of commands without blocking, running only those not already cached.
+    
+    Args:
+        commands (List[str]): The commands to execute
+        timeouts (Optional[List[Optional[float]]]): Per-command timeouts in seconds
+        bypass_cache (bool): Always run every command
+        
+    Returns:
+        List[str]: The output or error message of each command, in order
+    """
+    pending = self._pending(commands, bypass_cache)
+    if pending:
+      results = await self.executor.execute_batch_async(
+        pending, self._pending_timeouts(commands, timeouts, pending)
+      )
+      self._cache.update(zip(pending, results))
+    return [self._cache[command] for command in commands]
+  
+  def _pending(self, commands: List[str], bypass_cache: bool) -> List[str]:
+    """Get the unique commands from a batch that still need to run.
+    
+    Args:
+        commands (List[str]): The requested commands
+        bypass_cache (bool): Treat every command as uncached
+        
+    Returns:
+        List[str]: Commands to execute, without duplicates, in request order
+    """
+    pending = dict.fromkeys(c for c in commands if bypass_cache or c not in self._cache)
+    if len(pending) < len(commands):
+      logger.debug(f"Reusing cached output for {len(commands) - len(pending)} command(s)")
+    return list(pending)
+  
+  @staticmethod
+  def _pending_timeouts(commands: List[str], timeouts: Optional[List[Optional[float]]],
+                        pending: List[str]) -> Optional[List[Optional[float]]]:
+    """Select the timeouts that belong to the pending commands of a batch.
+    
+    Args:
+        commands (List[str]): The requested commands
+        timeouts (Optional[List[Optional[float]]]): Timeouts for the requested commands
+        pending (List[str]): The commands that will actually run
+        
+    Returns:
+        Optional[List[Optional[float]]]: Timeouts aligned with pending, or None
+    """
+    if not timeouts:
+      return None
+    by_command = dict(zip(commands, timeouts))
+    return [by_command.get(command) for command in pending]
+
+#fin
\ No newline at end of file
@@ -2,12 +2,173 @@
 
 """Local command executor implementation."""
 
+import asyncio
+import functools
 import logging
+import os
+import re
+import shlex
+import shutil
 import subprocess
-from typing import Optional
+import tempfile
+from typing import List, Optional, Tuple
+
+from executors.base import (
+  BATCH_TIMEOUT_GRACE, build_batch_script, communicate, parse_batch_output,
+  resolve_timeout, resolve_timeouts
+)
 
 logger = logging.getLogger("syshealth.executors.local")
 
+# Characters (and leading VAR=value assignments) that need a shell to interpret
+_SHELL_SYNTAX_RE = re.compile(r"[|&;<>()$`\\*?\[\]~{}#\n]|^\s*\w+=")
+
+@functools.lru_cache(maxsize=None)
+def _is_executable(name: str) -> bool:
+  """Check whether a program exists on PATH (shell builtins such as ulimit do not)."""
+  return shutil.which(name) is not None
+
+def _split_simple_command(command: str) -> Optional[List[str]]:
+  """Split a command into argv if it can run without a shell.
+  
+  Args:
+      command (str): The command line
+      
+  Returns:
+      Optional[List[str]]: The argument list, or None if the command uses
+          pipes, redirection, globbing or other shell syntax, or is not
+          an executable on PATH
+  """
+  if _SHELL_SYNTAX_RE.search(command):
+    return None
+  try:
+    argv = shlex.split(command)
+  except ValueError:
+    return None
+  return argv if argv and _is_executable(argv[0]) else None
+
+def _split_pipeline(command: str) -> Optional[List[List[str]]]:
+  """Split a command into the argv of each pipeline stage if it can run without a shell.
+  
+  The command is split on every ``|``. A ``|`` inside quotes leaves the
+  segment before it with an unterminated quote, which shlex rejects, and
+  ``||`` leaves an empty segment, so both fall back to the shell.
+  
+  Args:
+      command (str): The command line, e.g. ``ps aux --sort=-%cpu | head -n 10``
+      
+  Returns:
+      Optional[List[List[str]]]: The argument list of each stage, or None if
+          any stage needs a shell (see _split_simple_command())
+  """
+  stages = []
+  for segment in command.split("|"):
+    argv = _split_simple_command(segment)
+    if argv is None:
+      return None
+    stages.append(argv)
+  return stages
+
+def _run_pipeline(stages: List[List[str]], timeout: float) -> subprocess.CompletedProcess:
+  """Run a pipeline of programs directly, without a shell.
+  
+  As in the shell, the exit status is that of the last stage and the
+  stderr of every stage is captured. Stages still running once the last
+  one has exited are killed, since nothing can read their output any more.
+  
+  Args:
+      stages (List[List[str]]): Argument list of each stage
+      timeout (float): Seconds before the whole pipeline is killed
+      
+  Returns:
+      subprocess.CompletedProcess: Exit status and stdout of the last stage,
+          and the stderr of all stages
+      
+  Raises:
+      subprocess.TimeoutExpired: If the pipeline does not finish in time
+  """
+  processes = []
+  stdin = None
+  # A file rather than a pipe, so no stage can block on a full stderr pipe
+  with tempfile.TemporaryFile() as errors:
+    try:
+      for argv in stages[:-1]:
+        process = subprocess.Popen(argv, stdin=stdin, stdout=subprocess.PIPE, stderr=errors)
+        if stdin is not None:
+          stdin.close()
+        stdin = process.stdout
+        processes.append(process)
+      last = subprocess.Popen(stages[-1], stdin=stdin, stdout=subprocess.PIPE, stderr=errors, text=True)
+      if stdin is not None:
+        stdin.close()
+      processes.append(last)
+      try:
+        stdout, _ = last.communicate(timeout=timeout)
+      except subprocess.TimeoutExpired:
+        last.kill()
+        last.communicate()
+        raise
+    finally:
+      for process in processes:
+        if process.poll() is None:
+          process.kill()
+        process.wait()
+    errors.seek(0)
+    stderr = errors.read().decode(errors="replace")
+  return subprocess.CompletedProcess(stages[-1], last.returncode, stdout, stderr)
+
+async def _run_pipeline_async(stages: List[List[str]], timeout: float) -> Tuple[int, bytes, bytes]:
+  """Run a pipeline of programs directly, without a shell or blocking the event loop.
+  
+  See _run_pipeline() for the pipeline semantics.
+  
+  Args:
+      stages (List[List[str]]): Argument list of each stage
+      timeout (float): Seconds before the whole pipeline is killed
+      
+  Returns:
+      Tuple[int, bytes, bytes]: Exit status and stdout of the last stage,
+          and the stderr of all stages
+      
+  Raises:
+      TimeoutError: If the pipeline does not finish in time
+  """
+  processes = []
+  read_fd = None
+  with tempfile.TemporaryFile() as errors:
+    try:
+      for argv in stages[:-1]:
+        next_read_fd, write_fd = os.pipe()
+        try:
+          process = await asyncio.create_subprocess_exec(
+            *argv, stdin=read_fd, stdout=write_fd, stderr=errors
+          )
+        finally:
+          os.close(write_fd)
+          if read_fd is not None:
+            os.close(read_fd)
+          read_fd = next_read_fd
+        processes.append(process)
+      try:
+        last = await asyncio.create_subprocess_exec(
+          *stages[-1], stdin=read_fd, stdout=asyncio.subprocess.PIPE, stderr=errors
+        )
+      finally:
+        if read_fd is not None:
+          os.close(read_fd)
+      processes.append(last)
+      stdout, _ = await communicate(last, timeout=timeout)
+    finally:
+      for process in processes:
+        if process.returncode is None:
+          try:
+            process.kill()
+          except ProcessLookupError:
+            pass
+        await process.wait()
+    errors.seek(0)
+    return last.returncode, stdout, errors.read()
+
 class LocalCommandExecutor:
   """Executes commands on the local system.
   
@@ -15,25 +176,32 @@ class LocalCommandExecutor:
   error handling and security considerations.
   """
   
-  def execute(self, command: str) -> str:
+  def execute(self, command: str, timeout: Optional[float] = None) -> str:
     """Execute a command locally.
     
     Args:
         command (str): The command to execute
+        timeout (Optional[float]): Seconds before the command is killed;
+            defaults to get_command_timeout()
         
     Returns:
         str: The command output or error message
     """
     try:
-      # Use shell=True for local execution to support pipes and redirects
-      # Note: This maintains current behavior but should be addressed in security fixes
-      result = subprocess.run(
-        command,
-        capture_output=True,
-        text=True,
-        check=False,
-        shell=True
-      )
+      # Simple commands and plain pipelines of them are executed directly;
+      # anything using redirects or other shell syntax still goes through /bin/sh
+      stages = _split_pipeline(command)
+      if stages is None:
+        result = subprocess.run(
+          command,
+          capture_output=True,
+          text=True,
+          check=False,
+          shell=True,
+          timeout=resolve_timeout(timeout)
+        )
+      else:
+        result = _run_pipeline(stages, resolve_timeout(timeout))
       
       if result.returncode != 0:
         logger.warning(f"Local command returned non-zero exit status: {command}")
@@ -43,5 +211,97 @@ class LocalCommandExecutor:
     except Exception as e:
       logger.warning(f"Local command failed: {command} - {e}")
       return f"Error executing command: {str(e)}"
+  
+  async def execute_async(self, command: str, timeout: Optional[float] = None) -> str:
+    """Execute a command locally without blocking the event loop.
+    
+    Args:
+        command (str): The command to execute
+        timeout (Optional[float]): Seconds before the command is killed;
+            defaults to get_command_timeout()
+        
+    Returns:
+        str: The command output or error message
+    """
+    try:
+      stages = _split_pipeline(command)
+      if stages is None:
+        process = await asyncio.create_subprocess_shell(
+          command,
+          stdout=asyncio.subprocess.PIPE,
+          stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await communicate(process, timeout=resolve_timeout(timeout))
+        returncode = process.returncode
+      else:
+        returncode, stdout, stderr = await _run_pipeline_async(stages, resolve_timeout(timeout))
+      
+      if returncode != 0:
+        logger.warning(f"Local command returned non-zero exit status: {command}")
+        return f"Error: {stderr.decode(errors='replace')}"
+      
+      return stdout.decode(errors='replace')
+    except Exception as e:
+      logger.warning(f"Local command failed: {command} - {e}")
+      return f"Error executing command: {str(e)}"
+  
+  def execute_batch(self, commands: List[str],
+                    timeouts: Optional[List[Optional[float]]] = None) -> List[str]:
+    """Execute several commands locally in a single bash invocation.
+    
+    Args:
+        commands (List[str]): The commands to execute
+        timeouts (Optional[List[Optional[float]]]): Per-command timeouts in
+            seconds; None entries use get_command_timeout()
+        
+    Returns:
+        List[str]: The output or error message of each command, in order
+    """
+    timeouts = resolve_timeouts(len(commands), timeouts)
+    script, marker = build_batch_script(commands, timeouts)
+    try:
+      result = subprocess.run(
+        ["bash", "-s"],
+        input=script,
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=max(timeouts, default=0) + BATCH_TIMEOUT_GRACE
+      )
+      return parse_batch_output(result.stdout, marker, len(commands), result.stderr)
+    except Exception as e:
+      logger.warning(f"Local batch execution failed: {e}")
+      return [f"Error executing command: {str(e)}"] * len(commands)
+  
+  async def execute_batch_async(self, commands: List[str],
+                                timeouts: Optional[List[Optional[float]]] = None) -> List[str]:
+    """Execute several commands locally in a single bash invocation without blocking.
+    
+    Args:
+        commands (List[str]): The commands to execute
+        timeouts (Optional[List[Optional[float]]]): Per-command timeouts in
+            seconds; None entries use get_command_timeout()
+        
+    Returns:
+        List[str]: The output or error message of each command, in order
+    """
+    timeouts = resolve_timeouts(len(commands), timeouts)
+    script, marker = build_batch_script(commands, timeouts)
+    try:
+      process = await asyncio.create_subprocess_exec(
+        "bash", "-s",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+      )
+      stdout, stderr = await communicate(
+        process, script.encode(), max(timeouts, default=0) + BATCH_TIMEOUT_GRACE
+      )
+      return parse_batch_output(
+        stdout.decode(errors='replace'), marker, len(commands), stderr.decode(errors='replace')
+      )
+    except Exception as e:
+      logger.warning(f"Local batch execution failed: {e}")
+      return [f"Error executing command: {str(e)}"] * len(commands)
 
 #fin
\ No newline at end of file
@@ -2,18 +2,50 @@
 
 """Remote command executor implementation."""
 
+import asyncio
 import logging
+import os
 import subprocess
 import socket
-from typing import Optional
+import tempfile
+import threading
+from typing import List, Optional
+
+from config import get_config
+from executors.base import (
+  BATCH_TIMEOUT_GRACE, build_batch_script, communicate, parse_batch_output,
+  resolve_timeout, resolve_timeouts
+)
 
 logger = logging.getLogger("syshealth.executors.remote")
 
+def ssh_options() -> List[str]:
+  """Get the ssh options used for every connection.
+  
+  ``BatchMode`` makes a host that would prompt for a password or host key
+  fail immediately instead of hanging the run, ``ConnectTimeout`` bounds
+  the wait for an unreachable host, and ``ServerAliveInterval`` detects a
+  connection that dies mid-run.
+  
+  Returns:
+      List[str]: ``-o`` arguments for ssh
+  """
+  config = get_config()
+  return [
+    "-o", "BatchMode=yes",
+    "-o", f"ConnectTimeout={config.get('commands.ssh_connect_timeout', 10)}",
+    "-o", f"ServerAliveInterval={config.get('commands.ssh_server_alive_interval', 15)}",
+  ]
+
 class RemoteCommandExecutor:
   """Executes commands on a remote system via SSH.
   
   This executor runs commands on remote hosts using SSH with key-based
   authentication. It handles SSH connection failures gracefully.
+  
+  All commands for a host are multiplexed over a single OpenSSH
+  ControlMaster connection, which is opened on first use and torn down
+  by close() (or when used as a context manager).
   """
   
   def __init__(self, hostname: str):
@@ -23,26 +55,105 @@ class RemoteCommandExecutor:
         hostname (str): The remote hostname to connect to
     """
     self.hostname = hostname
+    self._control_path = os.path.join(
+      tempfile.gettempdir(), f"syshealth-{os.getpid()}-%r@%h:%p"
+    )
+    self._master_started = False
+    self._master_lock = threading.Lock()
+  
+  def __enter__(self) -> "RemoteCommandExecutor":
+    return self
+  
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.close()
+  
+  def __del__(self):
+    self.close()
+  
+  def _ensure_master(self):
+    """Start the ControlMaster connection if it is not running yet.
+    
+    Uses ``ssh -f`` so the call returns once authentication has completed
+    and the control socket is ready; see ssh_options() for the connection
+    options. If the master cannot be started, subsequent commands simply
+    open their own connections.
+    """
+    with self._master_lock:
+      if self._master_started:
+        return
+      self._master_started = True
+      
+      config = get_config()
+      ssh_timeout = config.get('commands.ssh_timeout', 60)
+      compression = "yes" if config.get('commands.ssh_compression', False) else "no"
+      try:
+        result = subprocess.run(
+          ["ssh", "-M", "-N", "-f",
+           *ssh_options(),
+           "-S", self._control_path,
+           "-o", f"ControlPersist={ssh_timeout}s",
+           "-o", f"Compression={compression}",
+           self.hostname],
+          capture_output=True,
+          text=True,
+          check=False,
+          timeout=ssh_timeout
+        )
+        if result.returncode != 0:
+          logger.warning(f"Failed to start SSH master connection to {self.hostname}: {result.stderr.strip()}")
+      except Exception as e:
+        logger.warning(f"Failed to start SSH master connection to {self.hostname}: {e}")
+  
+  def _ssh_command(self, command: str) -> List[str]:
+    """Build the ssh argument list for running a command over the master connection.
     
-  def execute(self, command: str) -> str:
+    Args:
+        command (str): The command to execute remotely
+        
+    Returns:
+        List[str]: The full ssh argument list
+    """
+    return ["ssh", "-T", *ssh_options(), "-S", self._control_path, self.hostname, command]
+  
+  def close(self):
+    """Shut down the ControlMaster connection if one was started."""
+    if not getattr(self, "_master_started", False):
+      return
+    self._master_started = False
+    try:
+      subprocess.run(
+        ["ssh", "-S", self._control_path, "-O", "exit", self.hostname],
+        capture_output=True,
+        check=False,
+        timeout=10
+      )
+    except Exception as e:
+      logger.debug(f"Failed to stop SSH master connection to {self.hostname}: {e}")
+    
+  def execute(self, command: str, timeout: Optional[float] = None) -> str:
     """Execute a command on the remote host.
     
     Args:
         command (str): The command to execute
+        timeout (Optional[float]): Seconds before the command is killed;
+            defaults to get_command_timeout()
         
     Returns:
         str: The command output or error message
     """
     try:
+      self._ensure_master()
+      
       # For SSH remote execution, pass the command as an argument
-      full_cmd = ["ssh", self.hostname, command]
+      full_cmd = self._ssh_command(command)
       
       result = subprocess.run(
         full_cmd,
         capture_output=True,
         text=True,
         check=False,
-        shell=False
+        shell=False,
+        timeout=resolve_timeout(timeout)
       )
       
       if result.returncode != 0:
@@ -53,5 +164,101 @@ class RemoteCommandExecutor:
     except Exception as e:
       logger.warning(f"Remote command failed on {self.hostname}: {command} - {e}")
       return f"Error executing remote command: {str(e)}"
+  
+  async def execute_async(self, command: str, timeout: Optional[float] = None) -> str:
+    """Execute a command on the remote host without blocking the event loop.
+    
+    The first call blocks while the master connection is established so
+    that concurrent commands all attach to the same session.
+    
+    Args:
+        command (str): The command to execute
+        timeout (Optional[float]): Seconds before the command is killed;
+            defaults to get_command_timeout()
+        
+    Returns:
+        str: The command output or error message
+    """
+    try:
+      self._ensure_master()
+      
+      process = await asyncio.create_subprocess_exec(
+        *self._ssh_command(command),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+      )
+      stdout, stderr = await communicate(process, timeout=resolve_timeout(timeout))
+      
+      if process.returncode != 0:
+        logger.warning(f"Remote command on {self.hostname} returned non-zero exit status: {command}")
+        return f"Error: {stderr.decode(errors='replace')}"
+      
+      return stdout.decode(errors='replace')
+    except Exception as e:
+      logger.warning(f"Remote command failed on {self.hostname}: {command} - {e}")
+      return f"Error executing remote command: {str(e)}"
+  
+  def execute_batch(self, commands: List[str],
+                    timeouts: Optional[List[Optional[float]]] = None) -> List[str]:
+    """Execute several commands on the remote host in a single SSH session.
+    
+    Args:
+        commands (List[str]): The commands to execute
+        timeouts (Optional[List[Optional[float]]]): Per-command timeouts in
+            seconds; None entries use get_command_timeout()
+        
+    Returns:
+        List[str]: The output or error message of each command, in order
+    """
+    timeouts = resolve_timeouts(len(commands), timeouts)
+    script, marker = build_batch_script(commands, timeouts)
+    try:
+      self._ensure_master()
+      
+      result = subprocess.run(
+        self._ssh_command("bash -s"),
+        input=script,
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=max(timeouts, default=0) + BATCH_TIMEOUT_GRACE
+      )
+      return parse_batch_output(result.stdout, marker, len(commands), result.stderr)
+    except Exception as e:
+      logger.warning(f"Remote batch execution failed on {self.hostname}: {e}")
+      return [f"Error executing remote command: {str(e)}"] * len(commands)
+  
+  async def execute_batch_async(self, commands: List[str],
+                                timeouts: Optional[List[Optional[float]]] = None) -> List[str]:
+    """Execute several commands on the remote host in a single SSH session without blocking.
+    
+    Args:
+        commands (List[str]): The commands to execute
+        timeouts (Optional[List[Optional[float]]]): Per-command timeouts in
+            seconds; None entries use get_command_timeout()
+        
+    Returns:
+        List[str]: The output or error message of each command, in order
+    """
+    timeouts = resolve_timeouts(len(commands), timeouts)
+    script, marker = build_batch_script(commands, timeouts)
+    try:
+      self._ensure_master()
+      
+      process = await asyncio.create_subprocess_exec(
+        *self._ssh_command("bash -s"),
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+      )
+      stdout, stderr = await communicate(
+        process, script.encode(), max(timeouts, default=0) + BATCH_TIMEOUT_GRACE
+      )
+      return parse_batch_output(
+        stdout.decode(errors='replace'), marker, len(commands), stderr.decode(errors='replace')
+      )
+    except Exception as e:
+      logger.warning(f"Remote batch execution failed on {self.hostname}: {e}")
+      return [f"Error executing remote command: {str(e)}"] * len(commands)
 
 #fin
\ No newline at end of file
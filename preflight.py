@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+
+"""Rule-based preflight checks for SysHealth
+
+This module inspects collected system information against the configured
+report thresholds before anything is sent to Claude. When every check
+passes and nothing unusual is found, a templated "system healthy" report
+can be produced locally, skipping the API call entirely.
+
+The checks are deliberately conservative: if a metric cannot be parsed,
+the system is not considered verifiably healthy and the full AI analysis
+is used instead.
+"""
+
+import json
+import re
+from typing import Dict, List, Optional
+
+# Use% and mount point columns of `df` output
+_DF_USAGE_RE = re.compile(r"^(\S+)\s+.*?(\d+)%\s+(/\S*)\s*$", re.MULTILINE)
+
+# Load averages as printed by `uptime`
+_LOAD_AVERAGE_RE = re.compile(r"load average[s]?:\s*([\d.]+),?\s+([\d.]+),?\s+([\d.]+)")
+
+# Sizes as printed by `free -h` (e.g. 5.9Gi, 478Mi, 0B)
+_SIZE_RE = re.compile(r"^([\d.]+)([KMGTP]?)i?B?$")
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4, "P": 1024**5}
+
+# Summary line printed by `systemctl list-units --state=failed`
+_FAILED_UNITS_RE = re.compile(r"^(\d+) loaded units? listed", re.MULTILINE)
+
+# Swap usage above this percentage is treated as a warning sign
+SWAP_USAGE_WARNING = 50
+
+# JSON summary included in templated healthy reports
+HEALTHY_SUMMARY = {
+  "critical": [],
+  "warnings": [],
+  "recommendations": [],
+  "summary": "All metrics are within the configured thresholds."
+}
+
+# chkrootkit lines reporting a positive finding ("not infected" is clean)
+_ROOTKIT_WARNING_RE = re.compile(r"(?<!not )\bINFECTED\b|^\s*warning\b", re.IGNORECASE | re.MULTILINE)
+
+# Header lines printed by package managers before the list of updates, and
+# the marker printed by the default commands when there are none
+_UPDATE_HEADER_MARKERS = ("Listing...", "Last metadata expiration check", "No pending updates")
+
+# Log output lines that mean "nothing to report"
+_EMPTY_LOG_MARKERS = ("not available", "-- No entries --")
+
+def parse_size(value: str) -> Optional[float]:
+  """Convert a human-readable size from `free -h` to bytes.
+  
+  Args:
+      value (str): Size such as "5.9Gi" or "0B"
+  
+  Returns:
+      Optional[float]: Size in bytes, or None if it cannot be parsed
+  """
+  match = _SIZE_RE.match(value)
+  if not match:
+    return None
+  return float(match.group(1)) * _SIZE_UNITS[match.group(2)]
+
+def _check_disks(disk_usage: str, thresholds: Dict) -> List[str]:
+  """Check filesystem usage against the disk warning threshold.
+  
+  Read-only loop/snap mounts are skipped since they are always full.
+  """
+  warning = thresholds.get('disk_usage_warning', 80)
+  rows = _DF_USAGE_RE.findall(disk_usage)
+  if not rows:
+    return ["disk usage could not be determined"]
+  
+  issues = []
+  for filesystem, percent, mount_point in rows:
+    if filesystem.startswith("/dev/loop") or mount_point.startswith("/snap/"):
+      continue
+    if int(percent) >= warning:
+      issues.append(f"{mount_point} is {percent}% full")
+  return issues
+
+def _check_memory(memory: str, thresholds: Dict) -> List[str]:
+  """Check RAM and swap usage from `free -h` output."""
+  warning = thresholds.get('memory_usage_warning', 85)
+  issues = []
+  mem_checked = False
+  
+  for line in memory.splitlines():
+    fields = line.split()
+    if not fields:
+      continue
+    if fields[0] == "Mem:" and len(fields) >= 7:
+      total, available = parse_size(fields[1]), parse_size(fields[6])
+      if total and available is not None:
+        mem_checked = True
+        used_percent = (total - available) / total * 100
+        if used_percent >= warning:
+          issues.append(f"memory usage is {used_percent:.0f}%")
+    elif fields[0] == "Swap:" and len(fields) >= 3:
+      total, used = parse_size(fields[1]), parse_size(fields[2])
+      if total and used is not None and used / total * 100 >= SWAP_USAGE_WARNING:
+        issues.append(f"swap usage is {used / total * 100:.0f}%")
+  
+  if not mem_checked:
+    issues.append("memory usage could not be determined")
+  return issues
+
+def _check_load(uptime: str, thresholds: Dict) -> List[str]:
+  """Check the 15-minute load average against the CPU warning threshold."""
+  warning = thresholds.get('cpu_load_warning', 2.0)
+  match = _LOAD_AVERAGE_RE.search(uptime)
+  if not match:
+    return ["load average could not be determined"]
+  load = float(match.group(3))
+  if load >= warning:
+    return [f"15-minute load average is {load}"]
+  return []
+
+def _check_failed_services(failed_services: str) -> List[str]:
+  """Check for failed systemd units."""
+  match = _FAILED_UNITS_RE.search(failed_services)
+  if not match:
+    return ["failed services could not be determined"]
+  if int(match.group(1)) > 0:
+    return [f"{match.group(1)} failed service(s)"]
+  return []
+
+def _check_updates(available_updates: str) -> List[str]:
+  """Check for pending package updates.
+  
+  Empty output means the package manager did not run (e.g. a pipeline
+  whose exit status came from ``head``), not that nothing is pending.
+  """
+  if "not available" in available_updates or not available_updates.strip():
+    return ["available updates could not be determined"]
+  updates = [
+    line for line in available_updates.splitlines()
+    if line.strip() and not line.startswith(_UPDATE_HEADER_MARKERS)
+  ]
+  if updates:
+    return [f"{len(updates)} pending package update(s)"]
+  return []
+
+def _check_rootkit(rootkit_check: str) -> List[str]:
+  """Check the rootkit scanner log for infections or warnings.
+  
+  A missing log (scanner not installed) is not an issue in itself.
+  """
+  findings = _ROOTKIT_WARNING_RE.findall(rootkit_check)
+  if findings:
+    return [f"{len(findings)} rootkit check warning(s)"]
+  return []
+
+def _check_log(name: str, output: str) -> List[str]:
+  """Check that a log excerpt contains no entries.
+  
+  A log that was read but had no matches shows "-- No entries --";
+  empty output means it could not be read.
+  """
+  if not output.strip():
+    return [f"{name} entries could not be determined"]
+  lines = [
+    line for line in output.splitlines()
+    if line.strip() and not any(marker in line for marker in _EMPTY_LOG_MARKERS)
+  ]
+  if lines:
+    return [f"{len(lines)} {name} entries"]
+  return []
+
+def find_issues(system_info: Dict, thresholds: Dict) -> List[str]:
+  """Find anything in the collected information that warrants AI analysis.
+  
+  Args:
+      system_info (Dict): The collected system information dictionary
+      thresholds (Dict): The ``report.thresholds`` configuration section
+  
+  Returns:
+      List[str]: Short descriptions of each problem found, or of each metric
+          that could not be verified. An empty list means the system is healthy.
+  """
+  issues = []
+  issues += _check_disks(system_info.get("disk_usage", ""), thresholds)
+  issues += _check_memory(system_info.get("memory", ""), thresholds)
+  issues += _check_load(system_info.get("uptime", ""), thresholds)
+  issues += _check_failed_services(system_info.get("failed_services", ""))
+  issues += _check_updates(system_info.get("available_updates", ""))
+  issues += _check_rootkit(system_info.get("rootkit_check", ""))
+  issues += _check_log("error log", system_info.get("recent_errors", ""))
+  issues += _check_log("authentication failure", system_info.get("auth_failures", ""))
+  if "FAILED" in system_info.get("disk_health", ""):
+    issues.append("SMART health check failed")
+  return issues
+
+def render_healthy_report(system_info: Dict) -> str:
+  """Render a markdown report for a system that passed every preflight check.
+  
+  Args:
+      system_info (Dict): The collected system information dictionary
+  
+  Returns:
+      str: Markdown report following the standard report sections
+  """
+  def block(key: str) -> str:
+    return f"```\n{system_info.get(key, 'Information not available').strip()}\n```"
+  
+  return f"""# System Health Report: {system_info.get('hostname', 'unknown')}
+
+*Generated by rule-based preflight checks at {system_info.get('timestamp', 'unknown time')}. \
+All metrics are within the configured thresholds, so AI analysis was skipped \
+(run with `--force-ai` to request a full analysis).*
+
+## 1. System Overview
+{block('os_release')}
+{block('uptime')}
+
+## 2. Hardware Configuration
+{block('cpu_model')}
+
+## 3. Storage Status
+{block('disk_usage')}
+
+## 4. Memory Usage
+{block('memory')}
+
+## 5. CPU Performance
+{block('top_cpu_processes')}
+
+## 6. Network Configuration
+{block('network_interfaces')}
+
+## 7. System Health
+No failed services, recent errors, authentication failures, pending updates,
+or rootkit warnings were found.
+
+## 8. Critical Issues
+None detected.
+
+## 9. Warnings
+None detected.
+
+## 10. Recommendations
+No action required.
+
+## Machine-Readable Summary
+```json
+{json.dumps(HEALTHY_SUMMARY, indent=2)}
+```
+"""
+
+#fin
\ No newline at end of file
@@ -20,33 +20,44 @@ Usage examples:
 """
 
 import argparse
+import asyncio
 import datetime
+import html
 import json
 import logging
 import os
+import re
 import shutil
 import smtplib
 import socket
-import subprocess
 import sys
-import tempfile
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, NamedTuple, Optional, TextIO, Tuple, Union
 
 # Import our Claude client
-from claude_client import ClaudeClient
+from claude_client import AsyncClaudeClient
+
+# markdown-it-py is optional; without it emailed reports are sent as preformatted text
+try:
+  from markdown_it import MarkdownIt
+except ImportError:
+  MarkdownIt = None
 
 # Import configuration management
 from config import (
     get_config, get_claude_model, get_default_language, 
-    get_output_directory, get_log_format
+    get_output_directory, get_log_format, get_output_settings, get_email_settings
 )
 
 # Constants
 VERSION = "1.0.0"  # Current version of SysHealth
 
+# Name of this machine; hosts matching it (case-insensitively) are analyzed without SSH
+LOCAL_HOSTNAME = socket.gethostname()
+_LOCAL_HOSTNAME_LOWER = LOCAL_HOSTNAME.lower()
+
 # Configure logging - default to WARNING level, verbose mode will change to INFO
 logging.basicConfig(
   level=logging.WARNING,
@@ -54,6 +65,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger("syshealth")
 
+# Fenced JSON summary block that reports end with
+_JSON_SUMMARY_RE = re.compile(r"```json[ \t]*\n(.*?)\n[ \t]*```", re.DOTALL)
+
+class HostReport(NamedTuple):
+  """Outcome of generating one host's report."""
+  host: str
+  system_info: Dict
+  report: Union[str, BaseException]
+  path: Optional[str] = None
+  summary: Optional[Dict] = None
+
 def parse_arguments():
   """Parse command line arguments for SysHealth.
   
@@ -96,6 +118,34 @@ def parse_arguments():
     default=default_output_dir,
     help=f"Directory to save reports (default: {default_output_dir})"
   )
+  parser.add_argument(
+    "--deep",
+    action="store_true",
+    help="Include the full hardware listing (lshw) instead of the short summary"
+  )
+  parser.add_argument(
+    "--force-ai",
+    action="store_true",
+    help="Always request AI analysis, even when preflight checks find no issues"
+  )
+  parser.add_argument(
+    "--no-cache",
+    action="store_true",
+    help="Do not reuse or store cached reports for unchanged systems"
+  )
+  parser.add_argument(
+    "--cache-ttl",
+    type=int,
+    metavar="SECONDS",
+    help="Reuse cached reports up to this many seconds old (default: claude.report_cache_ttl)"
+  )
+  parser.add_argument(
+    "--from-json",
+    action="append",
+    metavar="PATH",
+    help="Analyze system information saved by an earlier run instead of collecting it "
+         "(may be repeated; hosts are taken from the files)"
+  )
   parser.add_argument(
     "--mail",
     help="Comma-separated list of email addresses to send the report to (requires local SMTP server)"
@@ -103,7 +153,7 @@ def parse_arguments():
   parser.add_argument(
     "hosts", 
     nargs="*", 
-    default=[socket.gethostname()],
+    default=[LOCAL_HOSTNAME],
     help="Host(s) to analyze (default: current host; remote hosts require SSH key access)"
   )
   return parser.parse_args()
@@ -149,6 +199,17 @@ def check_dependencies():
     logger.warning(f"Missing recommended dependencies: {', '.join(missing_recommended)}")
     logger.info("For better results, install: sudo apt-get install " + " ".join(missing_recommended))
 
+def is_local_host(host: Optional[str]) -> bool:
+  """Check whether a host refers to this machine.
+  
+  Args:
+      host (Optional[str]): The hostname to check
+  
+  Returns:
+      bool: True if host is empty or matches the local hostname
+  """
+  return not host or host.lower() == _LOCAL_HOSTNAME_LOWER
+
 def execute_command(command: str, host: Optional[str] = None) -> str:
   """Execute a shell command locally or on a remote host.
   
@@ -167,46 +228,31 @@ def execute_command(command: str, host: Optional[str] = None) -> str:
           if the command fails
   
   Note:
-      - For local execution, shell=True is used to support pipes and redirects
-      - For remote execution, the command is passed as an argument to ssh
+      - For local execution, simple commands and pipelines run without a
+        shell; the shell is only used for redirects and other shell syntax
+        (see LocalCommandExecutor)
+      - For remote execution, the command is passed as an argument to ssh,
+        non-interactively (see RemoteCommandExecutor)
       - Non-zero exit codes are handled gracefully with warning logs
   """
-  try:
-    if host and host != socket.gethostname():
-      # For SSH remote execution, pass the entire command as a single string
-      full_cmd = ["ssh", host, command]
-      shell = False
-    else:
-      # For local execution with pipes and redirects, use shell=True
-      full_cmd = command
-      shell = True
-    
-    result = subprocess.run(
-      full_cmd,
-      capture_output=True,
-      text=True,
-      check=False,  # Don't raise exception on non-zero exit
-      shell=shell
-    )
-    
-    if result.returncode != 0:
-      logger.warning(f"Command returned non-zero exit status: {command}")
-      return f"Error: {result.stderr}"
-    
-    return result.stdout
-  except Exception as e:
-    logger.warning(f"Command failed: {command} - {e}")
-    return f"Error executing command: {str(e)}"
+  from executors import LocalCommandExecutor, RemoteCommandExecutor
+  
+  if is_local_host(host):
+    return LocalCommandExecutor().execute(command)
+  
+  # The executor's SSH master connection is closed when the command is done
+  with RemoteCommandExecutor(host) as executor:
+    return executor.execute(command)
 
-def collect_system_info(host: str) -> Dict:
+def collect_system_info(host: str, deep: bool = False) -> Dict:
   """Collect comprehensive system information from a host using modular collectors.
   
-  This function has been refactored to use specialized collector classes for better
-  maintainability, testability, and modularity. Each collector focuses on a specific
-  aspect of system information.
+  The commands for every collector are described declaratively in
+  collectors.registry and run together as a single batch.
   
   Args:
       host (str): The hostname to collect information from (local or remote)
+      deep (bool, optional): Collect the full hardware listing. Defaults to False.
   
   Returns:
       Dict: A dictionary containing all collected system information keyed by
@@ -223,85 +269,54 @@ def collect_system_info(host: str) -> Dict:
   logger.info(f"Collecting system information from {host}...")
   
   # Import collectors here to avoid circular imports
-  from collectors import (
-    BasicSystemInfoCollector,
-    HardwareInfoCollector, 
-    StorageInfoCollector,
-    ProcessInfoCollector,
-    NetworkInfoCollector,
-    SecurityInfoCollector
-  )
-  from executors import LocalCommandExecutor, RemoteCommandExecutor
+  from collectors import run_collectors
+  from executors import CachingCommandExecutor, LocalCommandExecutor, RemoteCommandExecutor
   from config import DEFAULT_COMMANDS
   
   # Determine the appropriate executor based on host
-  if host and host != socket.gethostname():
+  if not is_local_host(host):
     executor = RemoteCommandExecutor(host)
   else:
     executor = LocalCommandExecutor()
   
-  # Create collector instances with dependency injection
-  basic_collector = BasicSystemInfoCollector(executor, host, DEFAULT_COMMANDS)
-  hardware_collector = HardwareInfoCollector(executor, DEFAULT_COMMANDS) 
-  storage_collector = StorageInfoCollector(executor, DEFAULT_COMMANDS)
-  process_collector = ProcessInfoCollector(executor, DEFAULT_COMMANDS)
-  network_collector = NetworkInfoCollector(executor, DEFAULT_COMMANDS)
-  security_collector = SecurityInfoCollector(executor, DEFAULT_COMMANDS)
-  
-  # Collect information from each specialized collector
-  system_info = {}
-  
-  try:
-    system_info.update(basic_collector.collect())
-    logger.debug("Basic system information collected")
-  except Exception as e:
-    logger.warning(f"Failed to collect basic system info: {e}")
-  
-  try:
-    system_info.update(hardware_collector.collect())
-    logger.debug("Hardware information collected")
-  except Exception as e:
-    logger.warning(f"Failed to collect hardware info: {e}")
-  
-  try:
-    system_info.update(storage_collector.collect())
-    logger.debug("Storage information collected")
-  except Exception as e:
-    logger.warning(f"Failed to collect storage info: {e}")
-  
-  try:
-    system_info.update(process_collector.collect())
-    logger.debug("Process information collected")
-  except Exception as e:
-    logger.warning(f"Failed to collect process info: {e}")
-  
-  try:
-    system_info.update(network_collector.collect())
-    logger.debug("Network information collected")
-  except Exception as e:
-    logger.warning(f"Failed to collect network info: {e}")
+  # Commands shared between collectors only run once per collection
+  executor = CachingCommandExecutor(executor)
   
+  # Every collector's commands (see collectors.registry) run concurrently
+  # in one batch, so wall time is bounded by the slowest command
   try:
-    system_info.update(security_collector.collect())
-    logger.debug("Security information collected")
-  except Exception as e:
-    logger.warning(f"Failed to collect security info: {e}")
+    system_info = asyncio.run(run_collectors(executor, host, DEFAULT_COMMANDS, deep=deep))
+  finally:
+    # Tear down the SSH master connection once all commands have run
+    if isinstance(executor.executor, RemoteCommandExecutor):
+      executor.executor.close()
   
+  logger.debug(f"Collected {len(system_info)} system information fields")
   return system_info
 
-def call_claude_api(system_info: Dict, language: str, model: str, debug: bool = False, output_dir: str = None) -> str:
+async def call_claude_api(system_info: Dict, language: str, model: str, debug: bool = False, output_dir: str = None,
+                          stream_to: Optional[TextIO] = None, client: Optional[AsyncClaudeClient] = None,
+                          force_ai: bool = False, timestamp: Optional[str] = None) -> str:
   """Call Claude API to analyze system information and generate a health report.
   
-  Creates a Claude client instance, sends the collected system information
-  for analysis, and returns the generated health report. In debug mode,
-  saves the prompt sent to Claude to a file for troubleshooting.
+  Sends the collected system information to Claude for analysis and returns
+  the generated health report. In debug mode, saves the prompt sent to
+  Claude to a file for troubleshooting.
   
   Args:
       system_info (Dict): The collected system information dictionary
       language (str): The language code for the report (e.g., 'en', 'es')
       model (str): The Claude model to use for analysis
       debug (bool, optional): Whether to save the prompt to a file. Defaults to False.
-      output_dir (str, optional): Directory to save debug files. Required if debug=True.
+      output_dir (str, optional): Directory whose debug subdirectory receives debug
+          files; the subdirectory must already exist. Required if debug=True.
+      stream_to (Optional[TextIO], optional): Text stream that receives the report
+          as it is generated (e.g. sys.stdout in verbose mode). Defaults to None.
+      client (Optional[AsyncClaudeClient], optional): Client to use, so several
+          concurrent calls can share one. A new client is created if None.
+      force_ai (bool, optional): Call Claude even if preflight checks pass. Defaults to False.
+      timestamp (Optional[str], optional): Timestamp shared by all files of this
+          run, used to name the debug file; the current time if None
   
   Returns:
       str: The generated health report in markdown format
@@ -312,28 +327,27 @@ def call_claude_api(system_info: Dict, language: str, model: str, debug: bool =
   logger.info(f"Calling Claude API with model: {model}")
   
   # Create the Claude client
-  client = ClaudeClient(model=model)
+  if client is None:
+    client = AsyncClaudeClient(model=model)
+  
+  # In debug mode the client keeps the prompt it sends, so it is not rebuilt here
+  if debug:
+    client.keep_prompts = True
   
   # Analyze the system
-  response = client.analyze_system(system_info, language)
+  response = await client.analyze_system_async(system_info, language, stream_to=stream_to, force_ai=force_ai)
   
   # If in debug mode and output_dir is provided, save the prompt to a file
-  if debug and output_dir:
-    # Generate the prompt
-    prompt = client._generate_prompt(system_info, language)
-    
-    # Create debug directory
-    config = get_config()
-    debug_subdir = config.get('output.debug_subdirectory', 'debug')
-    debug_dir = os.path.join(output_dir, debug_subdir)
-    os.makedirs(debug_dir, exist_ok=True)
-    
+  hostname = system_info.get("hostname", "unknown")
+  prompt = client.sent_prompts.pop(hostname, None)
+  if debug and output_dir and prompt is None:
+    logger.debug(f"No prompt was sent to Claude for {hostname}")
+  elif debug and output_dir:
     # Save the prompt to a file
-    timestamp_format = config.get('output.timestamp_format', '%Y%m%d-%H%M%S')
-    debug_extension = config.get('output.file_extensions.debug', '.txt')
-    timestamp = datetime.datetime.now().strftime(timestamp_format)
-    hostname = system_info.get("hostname", "unknown")
-    prompt_file = os.path.join(debug_dir, f"{hostname}-{language}-prompt-{timestamp}{debug_extension}")
+    settings = get_output_settings()
+    debug_dir = os.path.join(output_dir, settings.debug_subdirectory)
+    timestamp = timestamp or run_timestamp()
+    prompt_file = os.path.join(debug_dir, f"{hostname}-{language}-prompt-{timestamp}{settings.debug_extension}")
     
     with open(prompt_file, "w") as f:
       f.write(prompt)
@@ -342,123 +356,490 @@ def call_claude_api(system_info: Dict, language: str, model: str, debug: bool =
   
   return response
 
-def save_report(report: str, host: str, output_dir: str, language: str) -> str:
-  """Save the generated health report to a markdown file.
+async def generate_reports(hosts: List[str], language: str, model: str, output_dir: str, deep: bool = False,
+                           debug: bool = False, stream_to: Optional[TextIO] = None, force_ai: bool = False,
+                           timestamp: Optional[str] = None, system_infos: Optional[Dict[str, Dict]] = None
+                           ) -> List[HostReport]:
+  """Collect system information from each host, then generate and save its health report.
+  
+  Hosts are processed concurrently, each as its own collect-analyze-save
+  pipeline, so a host's analysis starts as soon as its own collection
+  finishes and its report is written to disk as Claude generates it. The
+  number of hosts in flight is bounded by ``performance.max_concurrent_hosts``,
+  and all hosts share one Claude client whose connection is opened in the
+  background while collection runs.
+  
+  When ``claude.hosts_per_request`` is above 1, reports for several hosts
+  are instead requested together in one API call once all collection has
+  finished, and saved once the call returns. This is not used when
+  streaming or in debug mode, which both work per host.
+  
+  Each host's collected system information is saved as JSON under the
+  ``output.data_subdirectory`` of output_dir (see save_system_info()).
+  
+  Args:
+      hosts (List[str]): Hosts to analyze
+      language (str): The language code for the reports
+      model (str): The Claude model to use for analysis
+      output_dir (str): Directory to save reports and debug files
+      deep (bool, optional): Collect the full hardware listing. Defaults to False.
+      debug (bool, optional): Whether to save prompts to files. Defaults to False.
+      stream_to (Optional[TextIO], optional): Text stream that also receives report
+          text as it is generated; only sensible when analyzing a single host
+      force_ai (bool, optional): Call Claude even if preflight checks pass. Defaults to False.
+      timestamp (Optional[str], optional): Timestamp used in every file name, so
+          all files from one run can be correlated; the current time if None
+      system_infos (Optional[Dict[str, Dict]], optional): Previously saved system
+          information by host; these hosts are analyzed without collecting
+  
+  Returns:
+      List[HostReport]: The result for each host, in order, where report is the
+          exception raised if collection or analysis failed
+  """
+  timestamp = timestamp or run_timestamp()
+  settings = get_output_settings()
+  if debug:
+    os.makedirs(os.path.join(output_dir, settings.debug_subdirectory), exist_ok=True)
+  os.makedirs(os.path.join(output_dir, settings.data_subdirectory), exist_ok=True)
+  system_infos = system_infos or {}
+  
+  client = AsyncClaudeClient(model=model)
+  prewarm_task = asyncio.create_task(client.prewarm())
+  semaphore = asyncio.Semaphore(get_config().get('performance.max_concurrent_hosts', 5))
+  hosts_per_request = get_config().get('claude.hosts_per_request', 1)
+  loop = asyncio.get_running_loop()
+  
+  async def collect(host: str) -> Dict:
+    logger.info(f"Analyzing host: {host}")
+    if host in system_infos:
+      return system_infos[host]
+    # Collection runs its own event loop, so keep it off this one
+    system_info = await loop.run_in_executor(None, collect_system_info, host, deep)
+    save_system_info(system_info, output_dir, timestamp)
+    return system_info
+  
+  async def process(host: str) -> HostReport:
+    system_info = {}
+    async with semaphore:
+      try:
+        system_info = await collect(host)
+        await prewarm_task
+        report_file = ReportStream(report_path(host, output_dir, language, timestamp), echo=stream_to)
+      except Exception as e:
+        return HostReport(host, system_info, e)
+      try:
+        report = await call_claude_api(
+          system_info, language, model, debug=debug, output_dir=output_dir,
+          stream_to=report_file, client=client, force_ai=force_ai, timestamp=timestamp
+        )
+        report_file.finish(report)
+      except Exception as e:
+        report_file.abort()
+        return HostReport(host, system_info, e)
+    return HostReport(host, system_info, report, report_file.path, save_summary(report, report_file.path))
+  
+  if hosts_per_request <= 1 or len(hosts) <= 1 or stream_to is not None or debug:
+    return await asyncio.gather(*[process(host) for host in hosts])
+  
+  async def collect_only(host: str) -> Union[Dict, BaseException]:
+    async with semaphore:
+      try:
+        return await collect(host)
+      except Exception as e:
+        return e
+  
+  async def analyze_batch(batch: List[int]) -> List[Union[str, BaseException]]:
+    async with semaphore:
+      return await client.analyze_systems_async(
+        [collected[index] for index in batch], language, force_ai=force_ai
+      )
   
-  Creates the output directory if it doesn't exist, and saves the report
-  with a filename that includes the hostname, language, and timestamp.
+  collected = await asyncio.gather(*[collect_only(host) for host in hosts])
+  await prewarm_task
+  
+  ready = [index for index, info in enumerate(collected) if not isinstance(info, BaseException)]
+  batches = [ready[i:i + hosts_per_request] for i in range(0, len(ready), hosts_per_request)]
+  results: List[Union[str, BaseException]] = list(collected)
+  for batch, reports in zip(batches, await asyncio.gather(*[analyze_batch(batch) for batch in batches])):
+    for index, report in zip(batch, reports):
+      results[index] = report
+  
+  host_reports = []
+  for host, info, result in zip(hosts, collected, results):
+    info = {} if isinstance(info, BaseException) else info
+    if isinstance(result, BaseException):
+      host_reports.append(HostReport(host, info, result))
+      continue
+    try:
+      path = save_report(result, host, output_dir, language, timestamp)
+      host_reports.append(HostReport(host, info, result, path, save_summary(result, path)))
+    except Exception as e:
+      host_reports.append(HostReport(host, info, e))
+  return host_reports
+
+def run_timestamp() -> str:
+  """Format the current time for report and debug filenames.
+  
+  Returns:
+      str: The time formatted with ``output.timestamp_format``
+  """
+  return datetime.datetime.now().strftime(get_output_settings().timestamp_format)
+
+def report_path(host: str, output_dir: str, language: str, timestamp: Optional[str] = None) -> str:
+  """Build the path of a new report file.
+  
+  The filename includes the hostname, language, and timestamp. The output
+  directory is expected to exist already (main() creates it).
   
   Args:
-      report (str): The health report content to save
       host (str): The hostname the report is for
       output_dir (str): Directory to save the report
       language (str): The language code of the report
+      timestamp (Optional[str], optional): Timestamp shared by all files of
+          this run (see run_timestamp()); the current time if None
   
   Returns:
-      str: The absolute path to the saved report file
+      str: The path for the report file
   
   Example filename format: hostname-en-20250515-072617.md
   """
-  if not os.path.exists(output_dir):
-    os.makedirs(output_dir)
+  timestamp = timestamp or run_timestamp()
+  filename = f"{host}-{language}-{timestamp}{get_output_settings().report_extension}"
+  return os.path.join(output_dir, filename)
+
+def save_report(report: str, host: str, output_dir: str, language: str, timestamp: Optional[str] = None) -> str:
+  """Save the generated health report to a markdown file.
   
-  config = get_config()
-  timestamp_format = config.get('output.timestamp_format', '%Y%m%d-%H%M%S')
-  file_extension = config.get('output.file_extensions.report', '.md')
+  Args:
+      report (str): The health report content to save
+      host (str): The hostname the report is for
+      output_dir (str): Directory to save the report
+      language (str): The language code of the report
+      timestamp (Optional[str], optional): Timestamp shared by all files of
+          this run; the current time if None
   
-  timestamp = datetime.datetime.now().strftime(timestamp_format)
-  filename = f"{host}-{language}-{timestamp}{file_extension}"
-  filepath = os.path.join(output_dir, filename)
+  Returns:
+      str: The path to the saved report file
+  """
+  filepath = report_path(host, output_dir, language, timestamp)
   
   with open(filepath, "w") as f:
     f.write(report)
   
   return filepath
 
-def send_email(report_path: str, recipients: List[str], host: str) -> bool:
-  """Send the system health report via email to the specified recipients.
+def save_system_info(system_info: Dict, output_dir: str, timestamp: Optional[str] = None) -> Optional[str]:
+  """Save collected system information as JSON for diffing and re-analysis.
   
-  Reads the report file, converts markdown to HTML using pandoc, and sends
-  an email with both HTML content and the original markdown file attached.
+  The file is written to the data subdirectory of output_dir as
+  ``<host>-<timestamp>.json``, and a ``<host>-latest.json`` symlink is
+  pointed at it. Failures are logged and otherwise ignored.
   
   Args:
-      report_path (str): Path to the markdown report file
-      recipients (List[str]): List of email addresses to send the report to
-      host (str): The hostname the report is about (used in subject line)
+      system_info (Dict): The collected system information dictionary
+      output_dir (str): Directory whose data subdirectory receives the file;
+          the subdirectory must already exist
+      timestamp (Optional[str], optional): Timestamp shared by all files of
+          this run; the current time if None
   
   Returns:
-      bool: True if email was sent successfully, False otherwise
+      Optional[str]: The path to the saved file, or None if it could not be saved
+  """
+  data_dir = os.path.join(output_dir, get_output_settings().data_subdirectory)
+  host = system_info.get("hostname", "unknown")
+  data_path = os.path.join(data_dir, f"{host}-{timestamp or run_timestamp()}.json")
+  latest_path = os.path.join(data_dir, f"{host}-latest.json")
+  try:
+    with open(data_path, "w") as f:
+      json.dump(system_info, f, separators=(",", ":"))
+    
+    # Swap the symlink in atomically so readers never see it missing
+    temp_link = f"{latest_path}.{os.getpid()}"
+    os.symlink(os.path.basename(data_path), temp_link)
+    os.replace(temp_link, latest_path)
+  except OSError as e:
+    logger.warning(f"Failed to save system information for {host}: {e}")
+    return None
+  
+  logger.debug(f"Saved system information to: {data_path}")
+  return data_path
+
+def load_system_info(path: str) -> Dict:
+  """Load system information saved by save_system_info().
   
-  Requirements:
-      - Local SMTP server running on localhost
-      - pandoc installed for markdown to HTML conversion (falls back to plain text)
+  Args:
+      path (str): Path to the JSON file
   
-  Note:
-      The email includes both HTML formatted content and a markdown attachment
+  Returns:
+      Dict: The system information dictionary
+  
+  Raises:
+      ValueError: If the file does not contain a system information object
+  """
+  with open(path, "r") as f:
+    system_info = json.load(f)
+  if not isinstance(system_info, dict) or "hostname" not in system_info:
+    raise ValueError(f"{path} does not contain saved system information")
+  return system_info
+
+def extract_summary(report: str) -> Optional[Dict]:
+  """Extract the machine-readable summary that ends a report.
+  
+  Args:
+      report (str): The markdown report
+  
+  Returns:
+      Optional[Dict]: The parsed summary (critical, warnings, recommendations
+          and summary), or None if the report has no valid JSON summary block
   """
+  blocks = _JSON_SUMMARY_RE.findall(report)
+  if not blocks:
+    return None
   try:
-    # Get the report content
-    with open(report_path, "r") as f:
-      report_content = f.read()
-    
-    # Get the hostname for this machine
-    sender_hostname = socket.gethostname()
+    summary = json.loads(blocks[-1])
+  except ValueError:
+    return None
+  return summary if isinstance(summary, dict) else None
+
+def save_summary(report: str, report_path: str) -> Optional[Dict]:
+  """Save a report's JSON summary next to its markdown file.
+  
+  Args:
+      report (str): The markdown report
+      report_path (str): Path of the saved markdown report; the summary uses
+          the same name with the summary extension
+  
+  Returns:
+      Optional[Dict]: The summary, or None if the report has none
+  """
+  summary = extract_summary(report)
+  if summary is None:
+    logger.warning(f"Report has no machine-readable summary: {report_path}")
+    return None
+  
+  summary_path = os.path.splitext(report_path)[0] + get_output_settings().summary_extension
+  try:
+    with open(summary_path, "w") as f:
+      json.dump(summary, f, indent=2)
+    logger.debug(f"Saved report summary to: {summary_path}")
+  except OSError as e:
+    logger.warning(f"Failed to save report summary {summary_path}: {e}")
+  return summary
+
+def save_run_summary(results: List[HostReport], output_dir: str, timestamp: Optional[str] = None) -> str:
+  """Save one JSON file combining the summaries of every host in a run.
+  
+  Args:
+      results (List[HostReport]): The result for each host
+      output_dir (str): Directory to save the file
+      timestamp (Optional[str], optional): Timestamp shared by all files of
+          this run; the current time if None
+  
+  Returns:
+      str: The path to the saved file, ``run-<timestamp>.json`` by default
+  """
+  hosts = {}
+  for result in results:
+    if isinstance(result.report, BaseException):
+      hosts[result.host] = {"error": str(result.report)}
+    else:
+      hosts[result.host] = {"report": result.path, **(result.summary or {})}
+  
+  timestamp = timestamp or run_timestamp()
+  run_path = os.path.join(output_dir, f"run-{timestamp}{get_output_settings().summary_extension}")
+  with open(run_path, "w") as f:
+    json.dump({"timestamp": timestamp, "hosts": hosts}, f, indent=2)
+  return run_path
+
+class ReportStream:
+  """Text stream that saves a report to disk while Claude generates it.
+  
+  Each chunk is written to the report file as it arrives, so the file is
+  complete shortly after the last token rather than after the full response.
+  
+  Args:
+      path (str): Path of the markdown report file
+      echo (Optional[TextIO], optional): Stream that also receives each chunk
+          (e.g. sys.stdout in verbose mode). Defaults to None.
+  """
+  
+  def __init__(self, path: str, echo: Optional[TextIO] = None):
+    self.path = path
+    self.echo = echo
+    self.written = 0
+    self.file = open(path, "w")
+  
+  def write(self, text: str) -> int:
+    self.file.write(text)
+    if self.echo is not None:
+      self.echo.write(text)
+    self.written += len(text)
+    return len(text)
+  
+  def flush(self) -> None:
+    self.file.flush()
+    if self.echo is not None:
+      self.echo.flush()
+  
+  def finish(self, report: str) -> None:
+    """Close the report file.
     
-    # Create a temporary file for HTML conversion
-    with tempfile.NamedTemporaryFile(suffix=".html", delete=False) as html_file:
-      html_path = html_file.name
+    If what was streamed does not match the final report (a retried request
+    or a report that was not streamed), the file is rewritten.
     
-    # Convert markdown to HTML using pandoc
+    Args:
+        report (str): The complete report text
+    """
+    if self.written != len(report):
+      self.file.seek(0)
+      self.file.truncate()
+      self.file.write(report)
+    self.file.close()
+  
+  def abort(self) -> None:
+    """Discard a report whose generation failed."""
+    self.file.close()
     try:
-      subprocess.run(
-        ["pandoc", "-f", "markdown", "-t", "html", "-o", html_path],
-        input=report_content,
-        text=True,
-        check=True
-      )
-      
-      with open(html_path, "r") as f:
-        html_content = f.read()
-      
-      os.unlink(html_path)  # Clean up the temporary file
+      os.unlink(self.path)
+    except OSError:
+      pass
+
+def markdown_to_html(report_content: str) -> str:
+  """Convert a markdown report to HTML for email.
+  
+  Args:
+      report_content (str): The markdown report
+  
+  Returns:
+      str: The report as HTML, or as preformatted text if markdown-it-py is
+          not installed or conversion fails
+  """
+  if MarkdownIt is not None:
+    try:
+      return MarkdownIt("commonmark", {"html": True}).enable("table").render(report_content)
     except Exception as e:
       logger.warning(f"Failed to convert markdown to HTML: {e}")
-      html_content = f"<pre>{report_content}</pre>"  # Fallback if pandoc fails
-    
-    # Create the email message
-    config = get_config()
-    sender_name = config.get('email.sender.name', 'SysHealth')
-    domain_suffix = config.get('email.sender.domain_suffix', '@hostname').replace('@hostname', f'@{sender_hostname}')
-    subject_template = config.get('email.subject_template', 'System Health Report for {hostname}')
-    
-    msg = MIMEMultipart()
-    msg["From"] = f"{sender_name} <syshealth{domain_suffix}>"
-    msg["To"] = ", ".join(recipients)
-    msg["Subject"] = subject_template.format(hostname=host)
-    
-    # Add HTML version of the report
-    msg.attach(MIMEText(html_content, "html"))
-    
-    # Attach the original markdown file
-    filename = os.path.basename(report_path)
-    attachment = MIMEText(report_content)
-    attachment.add_header("Content-Disposition", f"attachment; filename={filename}")
-    msg.attach(attachment)
-    
-    # Send the email using SMTP server from configuration
-    config = get_config()
-    smtp_host = config.get('email.smtp.host', 'localhost')
-    smtp_port = config.get('email.smtp.port', 25)
-    smtp_timeout = config.get('email.smtp.timeout', 30)
-    
-    with smtplib.SMTP(smtp_host, smtp_port, timeout=smtp_timeout) as smtp:
-      smtp.send_message(msg)
-    
-    logger.info(f"Report sent via email to: {', '.join(recipients)}")
-    return True
-  except Exception as e:
-    logger.error(f"Failed to send email: {e}")
-    return False
+  return f"<pre>{html.escape(report_content)}</pre>"
+
+def sender_address() -> str:
+  """Build the From address for report emails.
+  
+  Returns:
+      str: The configured sender name and address, with ``@hostname`` in the
+          domain suffix replaced by the local hostname
+  """
+  settings = get_email_settings()
+  domain_suffix = settings.domain_suffix.replace('@hostname', f'@{LOCAL_HOSTNAME}')
+  return f"{settings.sender_name} <syshealth{domain_suffix}>"
+
+def build_email(report_content: str, report_path: str, recipients: List[str], host: str,
+                sender: Optional[str] = None) -> MIMEMultipart:
+  """Build the email message for a system health report.
+  
+  Converts the markdown report to HTML, and builds a message with both
+  HTML content and the original markdown file attached.
+  
+  Args:
+      report_content (str): The markdown report
+      report_path (str): Path to the saved markdown report file (used to name the attachment)
+      recipients (List[str]): List of email addresses to send the report to
+      host (str): The hostname the report is about (used in subject line)
+      sender (Optional[str], optional): The From address, as returned by
+          sender_address(); looked up if None
+  
+  Returns:
+      MIMEMultipart: The email message
+  """
+  html_content = markdown_to_html(report_content)
+  
+  # Create the email message
+  msg = MIMEMultipart()
+  msg["From"] = sender or sender_address()
+  msg["To"] = ", ".join(recipients)
+  msg["Subject"] = get_email_settings().subject_template.format(hostname=host)
+  
+  # Add HTML version of the report
+  msg.attach(MIMEText(html_content, "html"))
+  
+  # Attach the original markdown file
+  filename = os.path.basename(report_path)
+  attachment = MIMEText(report_content)
+  attachment.add_header("Content-Disposition", f"attachment; filename={filename}")
+  msg.attach(attachment)
+  
+  return msg
+
+def send_emails_batch(reports: List[Tuple[str, str, str]], recipients: List[str]) -> List[bool]:
+  """Send several system health reports over a single SMTP connection.
+  
+  Each report is sent as its own message (see build_email()). The
+  connection is reopened if the server drops it part way through.
+  
+  Args:
+      reports (List[Tuple[str, str, str]]): (host, report_path, report_content)
+          for each report to send
+      recipients (List[str]): List of email addresses to send the reports to
+  
+  Returns:
+      List[bool]: Whether each report was sent successfully, in order
+  
+  Requirements:
+      - Local SMTP server running on localhost
+      - markdown-it-py for markdown to HTML conversion (falls back to plain text)
+  """
+  # Send the email using SMTP server from configuration
+  settings = get_email_settings()
+  sender = sender_address()
+  
+  sent = []
+  smtp = None
+  try:
+    for host, report_path, report_content in reports:
+      try:
+        msg = build_email(report_content, report_path, recipients, host, sender)
+      except Exception as e:
+        logger.error(f"Failed to build email for host {host}: {e}")
+        sent.append(False)
+        continue
+      try:
+        if smtp is None:
+          smtp = smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=settings.smtp_timeout)
+        smtp.send_message(msg)
+      except Exception as e:
+        logger.error(f"Failed to send email for host {host}: {e}")
+        # Reconnect for the next report if the connection itself failed
+        lost = isinstance(e, smtplib.SMTPServerDisconnected) or not isinstance(e, smtplib.SMTPException)
+        if lost and smtp is not None:
+          smtp.close()
+          smtp = None
+        sent.append(False)
+        continue
+      logger.info(f"Report for {host} sent via email to: {', '.join(recipients)}")
+      sent.append(True)
+  finally:
+    if smtp is not None:
+      try:
+        smtp.quit()
+      except Exception:
+        smtp.close()
+  return sent
+
+def send_email(report_content: str, report_path: str, recipients: List[str], host: str) -> bool:
+  """Send the system health report via email to the specified recipients.
+  
+  Args:
+      report_content (str): The markdown report
+      report_path (str): Path to the saved markdown report file (used to name the attachment)
+      recipients (List[str]): List of email addresses to send the report to
+      host (str): The hostname the report is about (used in subject line)
+  
+  Returns:
+      bool: True if email was sent successfully, False otherwise
+  
+  Note:
+      The email includes both HTML formatted content and a markdown attachment
+  """
+  return send_emails_batch([(host, report_path, report_content)], recipients)[0]
 
 def main():
   """Main function to run the system health report generation process.
@@ -468,14 +849,16 @@ def main():
   2. Configure logging based on verbosity settings
   3. Check for required system dependencies
   4. Create the output directory
-  5. For each specified host:
-     a. Collect system information
-     b. Call Claude API to analyze and generate a report
-     c. Save the report to a file
-     d. Display the report if verbose mode is enabled
-  6. Send reports via email if requested
+  5. Collect system information from each specified host while the
+     Claude API connection is opened in the background
+  6. Call Claude API to analyze all hosts concurrently, writing each
+     report to a file as it is generated
+  7. Save a JSON summary of the whole run, and display each report if
+     verbose mode is enabled
+  8. Send reports via email if requested
   
-  The function exits with non-zero status if critical errors occur.
+  The function exits with non-zero status if critical errors occur or if
+  any host's report could not be generated.
   
   Returns:
       None
@@ -496,6 +879,24 @@ def main():
   
   check_dependencies()
   
+  # Saved system information replaces collection for the hosts it covers
+  system_infos = {}
+  if args.from_json:
+    for path in args.from_json:
+      try:
+        system_info = load_system_info(path)
+      except (OSError, ValueError) as e:
+        logger.error(f"Failed to load system information from {path}: {e}")
+        sys.exit(1)
+      system_infos[system_info["hostname"]] = system_info
+    args.hosts = list(system_infos)
+  
+  # Command-line cache settings override the configuration file
+  if args.no_cache:
+    get_config().set('claude.report_cache_ttl', 0)
+  elif args.cache_ttl is not None:
+    get_config().set('claude.report_cache_ttl', args.cache_ttl)
+  
   # Create output directory if it doesn't exist
   try:
     os.makedirs(args.output_dir, exist_ok=True)
@@ -503,32 +904,53 @@ def main():
     logger.error(f"Failed to create output directory {args.output_dir}: {e}")
     sys.exit(1)
     
-  # List to store paths of all generated reports
+  # Generated reports (host, path, content) to email
   report_paths = []
   
-  for host in args.hosts:
-    logger.info(f"Analyzing host: {host}")
-    
-    # Collect system information
-    system_info = collect_system_info(host)
-    
-    # Call Claude API with system info and debug flag
-    report = call_claude_api(
-      system_info, 
-      args.language, 
-      args.model, 
-      debug=args.debug, 
-      output_dir=args.output_dir
-    )
+  # With a single host the report is streamed to the terminal as Claude
+  # generates it; with several, reports are printed once all are done
+  stream_report = args.verbose and len(args.hosts) == 1
+  if stream_report:
+    print("\n" + "=" * 80)
+    print(f"HEALTH REPORT FOR {args.hosts[0]}:")
+    print("=" * 80, flush=True)
+  
+  # All files written by this run share one timestamp
+  timestamp = run_timestamp()
+  
+  # Collect system information, call Claude API and save the reports for all hosts
+  results = asyncio.run(generate_reports(
+    args.hosts,
+    args.language,
+    args.model,
+    args.output_dir,
+    deep=args.deep,
+    debug=args.debug,
+    stream_to=sys.stdout if stream_report else None,
+    force_ai=args.force_ai,
+    timestamp=timestamp,
+    system_infos=system_infos
+  ))
+  
+  if stream_report:
+    print("\n" + "=" * 80)
+  
+  run_summary_path = save_run_summary(results, args.output_dir, timestamp)
+  logger.info(f"Run summary saved to: {run_summary_path}")
+  
+  failed_hosts = []
+  for host, _, report, report_path, _ in results:
+    if isinstance(report, BaseException):
+      logger.error(f"Failed to generate report for host {host}: {report}")
+      failed_hosts.append(host)
+      continue
     
-    # Save report with the new naming format
-    report_path = save_report(report, host, args.output_dir, args.language)
-    report_paths.append((host, report_path))
+    report_paths.append((host, report_path, report))
     
     logger.info(f"Report saved to: {report_path}")
     
     # Display report if verbose
-    if args.verbose:
+    if args.verbose and not stream_report:
       print("\n" + "=" * 80)
       print(f"HEALTH REPORT FOR {host}:")
       print("=" * 80)
@@ -538,12 +960,16 @@ def main():
   # Send email if requested
   if args.mail:
     recipients = [email.strip() for email in args.mail.split(",")]
-    for host, report_path in report_paths:
-      if send_email(report_path, recipients, host):
+    for (host, _, _), sent in zip(report_paths, send_emails_batch(report_paths, recipients)):
+      if sent:
         logger.info(f"Email sent successfully for host: {host}")
       else:
         logger.error(f"Failed to send email for host: {host}")
   
+  if failed_hosts:
+    logger.error(f"Reports could not be generated for: {', '.join(failed_hosts)}")
+    sys.exit(1)
+  
   logger.info("All reports generated successfully")
 
 if __name__ == "__main__":
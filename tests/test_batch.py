@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+"""Tests for the marker-delimited batch protocol used to run many commands at once."""
+
+import time
+
+from executors.base import build_batch_script, parse_batch_output, truncate_output
+from executors.local import LocalCommandExecutor
+from config import get_max_deep_output_bytes, get_max_output_bytes
+
+def test_results_keep_command_order():
+    commands = ["sleep 0.3; echo first", "echo second", "sleep 0.1; echo third"]
+    assert LocalCommandExecutor().execute_batch(commands) == ["first\n", "second\n", "third\n"]
+
+def test_timed_out_command_does_not_hold_up_the_batch():
+    start = time.monotonic()
+    results = LocalCommandExecutor().execute_batch(["sleep 10", "echo done"], [0.5, None])
+    assert time.monotonic() - start < 5
+    assert results[0].startswith("Error")
+    assert results[1] == "done\n"
+
+def test_non_zero_exit_reports_stderr():
+    results = LocalCommandExecutor().execute_batch(["echo partial; echo oops >&2; exit 3", "true"])
+    assert results == ["Error: oops\n", ""]
+
+def test_marker_lookalikes_in_output_are_kept():
+    fake_marker = "__SYSHEALTH_0123456789abcdef0123456789abcdef__ 1 0"
+    results = LocalCommandExecutor().execute_batch([f"echo '{fake_marker}'; echo after", "echo second"])
+    assert results == [f"{fake_marker}\nafter\n", "second\n"]
+
+def test_output_without_trailing_newline_is_separated():
+    assert LocalCommandExecutor().execute_batch(["printf abc", "echo def"]) == ["abc", "def\n"]
+
+def test_long_output_keeps_its_tail():
+    full = "".join(f"{i}\n" for i in range(1, 200001))
+    result = LocalCommandExecutor().execute_batch(["seq 1 200000"])[0]
+    # One byte more than the larger cap, so truncate_output() still marks the cut
+    cap = max(get_max_output_bytes(), get_max_deep_output_bytes())
+    assert result == full[-(cap + 1):]
+    assert truncate_output(result) == truncate_output(full)
+    assert truncate_output(result).startswith("...[truncated]...\n")
+
+def test_missing_sections_report_the_batch_error():
+    script, marker = build_batch_script(["echo a", "echo b"])
+    output = f"{marker} 0 0\na\n"
+    assert parse_batch_output(output, marker, 2, "connection lost") == ["a\n", "Error: connection lost"]
+
+#fin
\ No newline at end of file
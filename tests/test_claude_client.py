@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+"""Tests for the cached static prompt sent with every Claude request."""
+
+import os
+import time
+
+import pytest
+
+claude_client = pytest.importorskip("claude_client")
+
+from collectors.registry import COLLECTOR_SPECS
+
+THRESHOLDS = {
+    "disk_usage_warning": 80,
+    "disk_usage_critical": 90,
+    "memory_usage_warning": 85,
+    "memory_usage_critical": 95,
+    "cpu_load_warning": 2.0,
+    "cpu_load_critical": 4.0,
+}
+
+@pytest.fixture
+def static_prompt():
+    """The static system prompt built from the default thresholds."""
+    return claude_client.BaseClaudeClient._static_prompt(None, THRESHOLDS)
+
+def test_static_prompt_is_long_enough_to_cache(static_prompt):
+    estimated_tokens = len(static_prompt) / claude_client.CHARS_PER_TOKEN
+    assert estimated_tokens >= claude_client.MIN_CACHEABLE_PROMPT_TOKENS
+
+def test_static_prompt_describes_every_collected_field(static_prompt):
+    for group in COLLECTOR_SPECS.values():
+        for key, _, _ in group:
+            assert f"\n- {key}: " in static_prompt
+
+def test_static_prompt_includes_thresholds(static_prompt):
+    assert "| Disk usage (%) | 80 | 90 |" in static_prompt
+
+@pytest.fixture
+def client(tmp_path):
+    """An async client with the default thresholds and a temporary report cache."""
+    client = claude_client.AsyncClaudeClient(api_key="test-key")
+    client._thresholds = dict(THRESHOLDS)
+    client._report_cache_ttl = 3600
+    client._report_cache_dir = str(tmp_path)
+    client._refresh_system_blocks()
+    return client
+
+def system_info(memory_used_percent=50, load=0.5):
+    """System information for a 100 GiB host with the given memory usage and load."""
+    available = 100 - memory_used_percent
+    return {
+        "hostname": "testhost",
+        "timestamp": "2025-01-01T12:00:00",
+        "uptime": f" 12:00:00 up 10 days,  1 user,  load average: {load}, {load}, {load}",
+        "memory": (
+            "               total        used        free      shared  buff/cache   available\n"
+            f"Mem:           100Gi       {memory_used_percent}Gi       {available}Gi       0Gi       0Gi        {available}Gi\n"
+            "Swap:          2.0Gi          0B       2.0Gi"
+        ),
+    }
+
+class TestReportCacheKey:
+    """Tests for BaseClaudeClient._report_cache_path()."""
+
+    def test_timestamp_and_small_changes_share_a_key(self, client):
+        first = client._report_cache_path(system_info(81), "en")
+        second = dict(system_info(84), timestamp="2025-01-01T13:00:00")
+        assert client._report_cache_path(second, "en") == first
+
+    @pytest.mark.parametrize("memory_used_percent", [89, 96])
+    def test_crossing_a_memory_threshold_changes_the_key(self, client, memory_used_percent):
+        assert (client._report_cache_path(system_info(81), "en")
+                != client._report_cache_path(system_info(memory_used_percent), "en"))
+
+    def test_crossing_the_load_threshold_changes_the_key(self, client):
+        assert (client._report_cache_path(system_info(load=1.5), "en")
+                != client._report_cache_path(system_info(load=2.5), "en"))
+
+    def test_language_changes_the_key(self, client):
+        assert client._report_cache_path(system_info(), "en") != client._report_cache_path(system_info(), "de")
+
+class TestReportCacheFiles:
+    """Tests for reading, expiring and pruning cached reports."""
+
+    def test_cached_report_is_read_back(self, client):
+        path = client._report_cache_path(system_info(), "en")
+        client._write_cached_report(path, "report")
+        assert client._read_cached_report(path) == "report"
+
+    def test_expired_report_is_deleted(self, client):
+        path = client._report_cache_path(system_info(), "en")
+        client._write_cached_report(path, "report")
+        expired = time.time() - client._report_cache_ttl - 1
+        os.utime(path, (expired, expired))
+        assert client._read_cached_report(path) is None
+        assert not os.path.exists(path)
+
+    def test_least_recently_used_reports_are_pruned(self, client):
+        client._report_cache_max_entries = 2
+        paths = [client._report_cache_path(system_info(load=load), "en") for load in (2.5, 4.5, 0.5)]
+        now = time.time()
+        for age, path in zip((30, 20), paths):
+            client._write_cached_report(path, "report")
+            os.utime(path, (now - age, now - age))
+        # Reading the oldest report makes it the most recently used
+        assert client._read_cached_report(paths[0]) == "report"
+        client._write_cached_report(paths[2], "report")
+        assert sorted(os.listdir(os.path.dirname(paths[0]))) == sorted(
+            os.path.basename(path) for path in (paths[0], paths[2])
+        )
+
+#fin
\ No newline at end of file
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+"""Tests for running local commands directly versus through /bin/sh."""
+
+import asyncio
+import subprocess
+
+import pytest
+
+from executors.local import LocalCommandExecutor, _run_pipeline, _split_pipeline
+
+# Commands run without a shell; each must behave exactly as under `sh -c`
+DIRECT_COMMANDS = [
+    "echo hello",
+    "seq 3",
+    "seq 3 | head -n 2",
+    "seq 5 | sort -r | uniq -c",
+    "echo abc | grep zzz",
+    "ls /nonexistent-syshealth-path",
+    "echo x | ls /nonexistent-syshealth-path",
+    "ls /nonexistent-syshealth-path | head -n 1",
+    "ls /nonexistent-syshealth-path | grep x",
+    "yes | head -n 3",
+]
+
+# Commands that need a shell to interpret them
+SHELL_COMMANDS = [
+    "echo 'x|y' | tr '|' -",
+    "echo abc | grep 'a|b'",
+    "false || echo fallback",
+    "true && echo done",
+    "echo $HOME",
+    "echo hello > /dev/null",
+    "cd / && pwd",
+    "ulimit -n",
+    "LC_ALL=C echo hello",
+    "printf 'a\\nb\\n'",
+]
+
+def run_shell(command):
+    """Run a command through /bin/sh as the executor's fallback does."""
+    return subprocess.run(command, shell=True, capture_output=True, text=True, check=False)
+
+@pytest.mark.parametrize("command", DIRECT_COMMANDS)
+def test_direct_pipeline_matches_shell(command):
+    assert _split_pipeline(command) is not None
+    direct = _run_pipeline(_split_pipeline(command), timeout=10)
+    shell = run_shell(command)
+    assert direct.returncode == shell.returncode
+    assert direct.stdout == shell.stdout
+    assert direct.stderr == shell.stderr
+
+@pytest.mark.parametrize("command", SHELL_COMMANDS)
+def test_shell_syntax_falls_back_to_shell(command):
+    assert _split_pipeline(command) is None
+
+@pytest.mark.parametrize("command", DIRECT_COMMANDS + SHELL_COMMANDS)
+def test_execute_matches_shell(command):
+    shell = run_shell(command)
+    expected = shell.stdout if shell.returncode == 0 else f"Error: {shell.stderr}"
+    assert LocalCommandExecutor().execute(command, timeout=10) == expected
+
+@pytest.mark.parametrize("command", DIRECT_COMMANDS + SHELL_COMMANDS)
+def test_execute_async_matches_execute(command):
+    executor = LocalCommandExecutor()
+    assert asyncio.run(executor.execute_async(command, timeout=10)) == executor.execute(command, timeout=10)
+
+def test_direct_pipeline_times_out():
+    with pytest.raises(subprocess.TimeoutExpired):
+        _run_pipeline(_split_pipeline("sleep 5 | cat"), timeout=0.2)
+
+#fin
\ No newline at end of file
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+"""Tests for the rule-based preflight checks that decide whether Claude is called."""
+
+import pytest
+
+from preflight import find_issues, render_healthy_report
+
+THRESHOLDS = {
+    "disk_usage_warning": 80,
+    "memory_usage_warning": 85,
+    "cpu_load_warning": 2.0,
+}
+
+@pytest.fixture
+def healthy_system_info():
+    """System information for a host that passes every preflight check."""
+    return {
+        "hostname": "testhost",
+        "timestamp": "2025-01-01T12:00:00",
+        "uptime": " 12:00:00 up 10 days,  1 user,  load average: 0.10, 0.20, 0.30",
+        "memory": (
+            "               total        used        free      shared  buff/cache   available\n"
+            "Mem:            16Gi       4.0Gi       8.0Gi       0.1Gi       4.0Gi        12Gi\n"
+            "Swap:          2.0Gi          0B       2.0Gi"
+        ),
+        "disk_usage": (
+            "Filesystem      Size  Used Avail Use% Mounted on\n"
+            "/dev/sda1       100G   50G   50G  50% /"
+        ),
+        "failed_services": "  UNIT LOAD ACTIVE SUB DESCRIPTION\n0 loaded units listed.",
+        "recent_errors": "-- No entries --",
+        "auth_failures": "-- No entries --",
+        "available_updates": "Listing...",
+        "rootkit_check": "Checking `ls'... not infected\nChecking `ps'... not infected",
+        "disk_health": "SMART overall-health self-assessment test result: PASSED",
+    }
+
+class TestFindIssues:
+    """Tests for find_issues()."""
+
+    def test_healthy_system_has_no_issues(self, healthy_system_info):
+        assert find_issues(healthy_system_info, THRESHOLDS) == []
+
+    def test_missing_rootkit_log_is_not_an_issue(self, healthy_system_info):
+        healthy_system_info["rootkit_check"] = "Rootkit check logs not available (install: sudo apt install chkrootkit)"
+        assert find_issues(healthy_system_info, THRESHOLDS) == []
+
+    @pytest.mark.parametrize("log", [
+        "Checking `ls'... INFECTED",
+        "Checking `ps'... not infected\nWarning: Possible Malicious Linux.Xor.DDoS installed",
+    ])
+    def test_rootkit_findings_are_issues(self, healthy_system_info, log):
+        healthy_system_info["rootkit_check"] = log
+        assert find_issues(healthy_system_info, THRESHOLDS) == ["1 rootkit check warning(s)"]
+
+    def test_pending_updates_are_issues(self, healthy_system_info):
+        healthy_system_info["available_updates"] = (
+            "Listing...\n"
+            "openssl/stable-security 3.0.15-1 amd64 [upgradable from: 3.0.14-1]\n"
+            "libssl3/stable-security 3.0.15-1 amd64 [upgradable from: 3.0.14-1]"
+        )
+        assert find_issues(healthy_system_info, THRESHOLDS) == ["2 pending package update(s)"]
+
+    def test_unavailable_updates_are_not_healthy(self, healthy_system_info):
+        healthy_system_info["available_updates"] = "Update information not available"
+        assert find_issues(healthy_system_info, THRESHOLDS) == ["available updates could not be determined"]
+
+    @pytest.mark.parametrize("output", [
+        "No pending updates",
+        "Last metadata expiration check: 0:12:03 ago on Wed 01 Jan 2025 11:48:00 AM UTC.\nNo pending updates",
+    ])
+    def test_no_pending_updates_is_healthy(self, healthy_system_info, output):
+        healthy_system_info["available_updates"] = output
+        assert find_issues(healthy_system_info, THRESHOLDS) == []
+
+    def test_empty_updates_are_not_healthy(self, healthy_system_info):
+        healthy_system_info["available_updates"] = ""
+        assert find_issues(healthy_system_info, THRESHOLDS) == ["available updates could not be determined"]
+
+    @pytest.mark.parametrize("key, issue", [
+        ("recent_errors", "error log entries could not be determined"),
+        ("auth_failures", "authentication failure entries could not be determined"),
+    ])
+    def test_empty_logs_are_not_healthy(self, healthy_system_info, key, issue):
+        healthy_system_info[key] = "\n"
+        assert find_issues(healthy_system_info, THRESHOLDS) == [issue]
+
+    def test_unavailable_auth_log_is_not_an_issue(self, healthy_system_info):
+        healthy_system_info["auth_failures"] = "Authentication logs not available"
+        assert find_issues(healthy_system_info, THRESHOLDS) == []
+
+    def test_empty_outputs_are_not_healthy(self, healthy_system_info):
+        for key in ("available_updates", "auth_failures", "recent_errors", "rootkit_check", "disk_health"):
+            healthy_system_info[key] = ""
+        assert find_issues(healthy_system_info, THRESHOLDS) != []
+
+    def test_unavailable_failed_services_are_not_healthy(self, healthy_system_info):
+        healthy_system_info["failed_services"] = "Failed services information not available"
+        assert find_issues(healthy_system_info, THRESHOLDS) == ["failed services could not be determined"]
+
+    def test_failed_services_are_issues(self, healthy_system_info):
+        healthy_system_info["failed_services"] = "  UNIT LOAD ACTIVE SUB DESCRIPTION\n2 loaded units listed."
+        assert find_issues(healthy_system_info, THRESHOLDS) == ["2 failed service(s)"]
+
+    def test_full_disk_is_an_issue(self, healthy_system_info):
+        healthy_system_info["disk_usage"] = (
+            "Filesystem      Size  Used Avail Use% Mounted on\n"
+            "/dev/sda1       100G   91G    9G  91% /"
+        )
+        assert find_issues(healthy_system_info, THRESHOLDS) == ["/ is 91% full"]
+
+    def test_high_load_is_an_issue(self, healthy_system_info):
+        healthy_system_info["uptime"] = " 12:00:00 up 10 days,  1 user,  load average: 5.00, 4.00, 3.00"
+        assert find_issues(healthy_system_info, THRESHOLDS) == ["15-minute load average is 3.0"]
+
+    def test_error_log_entries_are_issues(self, healthy_system_info):
+        healthy_system_info["recent_errors"] = "Jan 01 12:00:00 testhost kernel: I/O error"
+        assert find_issues(healthy_system_info, THRESHOLDS) == ["1 error log entries"]
+
+    def test_missing_metrics_are_not_healthy(self):
+        issues = find_issues({"hostname": "testhost"}, THRESHOLDS)
+        assert "disk usage could not be determined" in issues
+        assert "memory usage could not be determined" in issues
+        assert "load average could not be determined" in issues
+        assert "failed services could not be determined" in issues
+
+def test_healthy_report_names_host(healthy_system_info):
+    report = render_healthy_report(healthy_system_info)
+    assert report.startswith("# System Health Report: testhost")
+
+#fin
\ No newline at end of file